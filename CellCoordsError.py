@@ -1,3 +0,0 @@
-class CellCoordsError(Exception):
-    '''Ошибка в указании координаты ячейки.'''
-    pass
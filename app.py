@@ -1,5 +1,8 @@
-from Controller import Controller
+import sys
+from sea_battle.controller import Controller
 
 if __name__ == '__main__':
-    controller = Controller()
+    # необязательный аргумент командной строки - зерно партии
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    controller = Controller(seed=seed)
     controller.start_game()
@@ -0,0 +1,90 @@
+'''Замер времени холодного запуска пакета sea_battle.
+
+Каждый сценарий выполняется в отдельном процессе интерпретатора несколько раз,
+в качестве результата берется медиана. Из нее вычитается время запуска пустого
+интерпретатора, и оставшееся время импорта сравнивается с бюджетом.
+
+Запуск: python bench_startup.py [--runs N] [--budget МС]
+Код возврата 1 означает, что бюджет превышен или безголовый процесс
+загрузил модули интерактивной игры.
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+# сценарий -> код, который выполняется в новом процессе
+SCENARIOS = {
+    'baseline': 'pass',
+    'headless': 'import sea_battle; sea_battle.Board; sea_battle.AIPlayer',
+    'interactive': 'import sea_battle; sea_battle.Controller',
+}
+
+# модули, которые не должны загружаться в безголовом процессе;
+# typing дорог при импорте, поэтому аннотации пакета записываются строками
+INTERACTIVE_MODULES = ('sea_battle.controller', 'sea_battle.move_timer', 'json', 'typing')
+
+
+def measure(code: str, runs: int) -> float:
+    '''Вернуть медиану времени выполнения кода в новом процессе в миллисекундах.
+
+    Аргументы:
+    code - выполняемый код.
+    runs - количество запусков.
+    '''
+    root = os.path.dirname(os.path.abspath(__file__))
+    times = []
+
+    for i in range(runs):
+        start = perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
+        times.append((perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def headless_modules() -> list[str]:
+    '''Вернуть модули интерактивной игры, загруженные безголовым процессом.'''
+    code = (SCENARIOS['headless'] + '; import sys; '
+            f'print(" ".join(m for m in {INTERACTIVE_MODULES!r} if m in sys.modules))')
+    root = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, '-c', code], cwd=root, check=True,
+                            capture_output=True, text=True)
+    return result.stdout.split()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Замер времени холодного запуска пакета sea_battle.')
+    parser.add_argument('--runs', type=int, default=15, help='количество запусков каждого сценария')
+    parser.add_argument('--budget', type=float, default=25.0,
+                        help='допустимое время импорта для безголового процесса, мс')
+    args = parser.parse_args()
+
+    # первый запуск компилирует модули, он не учитывается
+    measure(SCENARIOS['interactive'], 1)
+
+    results = {name: measure(code, args.runs) for name, code in SCENARIOS.items()}
+    baseline = results['baseline']
+
+    for name, value in results.items():
+        print(f'{name}: {value:.1f} мс (импорт {value - baseline:.1f} мс)')
+
+    ok = True
+    headless = results['headless'] - baseline
+
+    if headless > args.budget:
+        print(f'Бюджет превышен: {headless:.1f} мс > {args.budget:.1f} мс.')
+        ok = False
+
+    loaded = headless_modules()
+
+    if loaded:
+        print(f'Безголовый процесс загрузил модули интерактивной игры: {", ".join(loaded)}.')
+        ok = False
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
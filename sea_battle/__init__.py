@@ -0,0 +1,53 @@
+'''Игра "Морской бой".
+
+Публичные классы загружаются при первом обращении к ним, поэтому
+процесс, которому нужна только доска, не импортирует контроллер
+и остальные модули пакета.
+'''
+from importlib import import_module
+
+# имя класса -> модуль пакета, в котором он определен
+_exports = {
+    'AIPlayer': 'ai_player',
+    'BattleController': 'battle_controller',
+    'Board': 'board',
+    'BoardArena': 'board_arena',
+    'BoardView': 'board_view',
+    'Cell': 'cell',
+    'Controller': 'controller',
+    'GameStats': 'game_stats',
+    'MoveTimer': 'move_timer',
+    'PlacementModel': 'placement_model',
+    'RandomSource': 'random_source',
+    'ScriptedController': 'scripted_controller',
+    'Ship': 'ship',
+    'Spectator': 'spectator',
+    'SpectatorHub': 'spectator_hub',
+    'TurnScheduler': 'turn_scheduler',
+    'BoardCreationError': 'errors',
+    'CellCoordsError': 'errors',
+    'CellsAllocationError': 'errors',
+    'ChangeForbiddenError': 'errors',
+    'InvalidCoordsError': 'errors',
+    'ScriptExhaustedError': 'errors',
+    'ShipDislocationAreaError': 'errors',
+    'ShipExistsError': 'errors',
+    'ShootError': 'errors',
+    'UndoError': 'errors',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    '''Загрузить публичный класс пакета при первом обращении к нему.'''
+    if name not in _exports:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(f'.{_exports[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,133 @@
+# аннотации ссылаются на классы через пакет: он загружает их модули только при обращении
+import sea_battle
+from .random_source import RandomSource
+
+
+class AIPlayer:
+    '''Класс описывающий игрока ИИ.
+
+    Аргументы:
+    min_coord - минимальная координата для совершения выстрела.
+    max_coord - максимальная координата для совершения выстрела.
+    rng - генератор случайных чисел игрока. Если не указан, создается новый.
+    prior - модель расстановки кораблей соперника. Если указана, чаще занятые
+    ячейки обстреливаются раньше.
+    candidates - множество координат, по которым еще имеет смысл стрелять,
+    поддерживаемое доской соперника (Board.unknown_cells). Если указано,
+    выстрелы по остальным ячейкам пропускаются.
+
+    Методы экземпляра:
+    shoot - совершить выстрел и запомнить его данные.
+    propose(deadline: float) - генератор вариантов следующего выстрела.
+    commit(coords: tuple) - запомнить выбранный выстрел.
+    '''
+    def __init__(self, min_coord: int, max_coord: int, rng: RandomSource = None,
+                 prior: 'sea_battle.PlacementModel' = None, candidates: set[tuple[int, int]] = None) -> None:
+        self._min_coord = min_coord
+        self._max_coord = max_coord
+        self._rng = rng if rng is not None else RandomSource()
+        self._candidates = candidates
+        # координаты совершенных ранее выстрелов
+        self._coords = []
+        # порядок выстрелов по всем ячейкам определяется один раз при создании игрока,
+        # поэтому каждый выстрел не требует обращений к генератору и повторных попыток
+        self._order = [(x, y)
+                       for x in range(min_coord, max_coord + 1)
+                       for y in range(min_coord, max_coord + 1)]
+
+        if prior is None:
+            self._rng.shuffle(self._order)
+        else:
+            # случайный порядок без возвращения с вероятностями, пропорциональными весам модели
+            keys = {coords: self._rng.random() ** (1 / prior.weight(*coords)) for coords in self._order}
+            self._order.sort(key=keys.get)
+
+    def shoot(self) -> tuple[int, int]:
+        '''Совершить выстрел и запомнить его данные.'''
+        self._prune()
+        coords = self._order.pop()
+        self._coords.append(coords)
+        return coords
+
+    def _prune(self) -> None:
+        '''Убрать из конца порядка выстрелов ячейки, которые уже не входят в кандидаты.'''
+        if self._candidates is None:
+            return
+
+        while self._order and self._order[-1] not in self._candidates:
+            self._order.pop()
+
+    def propose(self, deadline: float = None):
+        '''Генератор вариантов следующего выстрела, каждый следующий не хуже предыдущего.
+        Первый вариант выдается сразу и служит запасным ходом. Порядок выстрелов
+        определен заранее, поэтому вариант всегда один.
+
+        Аргументы:
+        deadline - момент по time.perf_counter, к которому нужно выбрать выстрел.
+        '''
+        self._prune()
+        yield self._order[-1]
+
+    def commit(self, coords: tuple[int, int]) -> None:
+        '''Запомнить выбранный выстрел.
+
+        Аргументы:
+        coords - координаты выстрела, полученные от propose.
+        '''
+        if self._order[-1] == coords:
+            self._order.pop()
+        else:
+            self._order.remove(coords)
+        self._coords.append(coords)
+
+
+if __name__ == '__main__':
+    from .board import Board
+    from .placement_model import PlacementModel
+    from .ship import Ship
+
+    board = Board()
+    ai = AIPlayer(board.min, board.max)
+
+    coords = ai.shoot()
+    print(coords)
+
+    assert coords in ai._coords
+
+    # одинаковое зерно дает одинаковую последовательность выстрелов
+    ai_1 = AIPlayer(board.min + 1, board.max + 1, RandomSource(7))
+    ai_2 = AIPlayer(board.min + 1, board.max + 1, RandomSource(7))
+    shots = [ai_1.shoot() for i in range(36)]
+
+    assert shots == [ai_2.shoot() for i in range(36)]
+    assert len(set(shots)) == 36
+
+    # ячейки, которые соперник занимает чаще, обстреливаются раньше
+    prior = PlacementModel()
+    board = Board(verbose=False)
+    board.add_ship(Ship({'x': 0, 'y': 0}, 3))
+
+    for i in range(50):
+        prior.update(board)
+
+    first_shots = []
+    for seed in range(100):
+        ai = AIPlayer(board.min + 1, board.max + 1, RandomSource(seed), prior)
+        first_shots.append(ai.shoot())
+
+    assert sum(coords in ((1, 1), (1, 2), (1, 3)) for coords in first_shots) > 50
+
+    # ячейки вокруг потопленного корабля исключаются из кандидатов и не обстреливаются
+    board = Board(verbose=False, reveal_halo=True)
+    board.add_ship(Ship({'x': 0, 'y': 0}, 1))
+    board.process_shot(1, 1)
+    ai = AIPlayer(board.min + 1, board.max + 1, RandomSource(3), candidates=board.unknown_cells)
+    shots = []
+
+    while not board.all_cells_are_shot:
+        coords = ai.shoot()
+        board.process_shot(*coords)
+        shots.append(coords)
+
+    assert len(shots) == 32
+    assert not {(1, 2), (2, 1), (2, 2)} & set(shots)
@@ -0,0 +1,139 @@
+import sys
+from .errors import BoardCreationError
+from .controller import Controller
+from .ai_player import AIPlayer
+from .random_source import RandomSource
+from .turn_scheduler import TurnScheduler
+
+
+class BattleController(Controller):
+    '''Класс описывающий контроллера игры нескольких игроков ИИ, у каждого из которых своя доска.
+
+    Каждый ход игрок выбирает доску случайного соперника на плаву. Если выстрел
+    успешный, игрок ходит еще раз. Игрок, все корабли которого потоплены, выбывает.
+    Побеждает последний игрок на плаву.
+
+    Аргументы:
+    players - количество игроков.
+    seed - зерно генератора случайных чисел игры.
+    rng - генератор случайных чисел игры. Если указан, seed игнорируется.
+    verbose - индикатор того, что ход игры нужно выводить в консоль.
+    reveal_halo - индикатор того, что ячейки вокруг потопленного корабля
+    сразу отмечаются как промахи.
+
+    Атрибуты экземпляра:
+    turns - количество сделанных выстрелов.
+    '''
+    def __init__(self, players: int, seed=None, rng: RandomSource = None,
+                 verbose: bool = False, reveal_halo: bool = False) -> None:
+        super().__init__(seed, rng, reveal_halo=reveal_halo)
+
+        if players < 2:
+            raise ValueError('Количество игроков должно быть не меньше двух.')
+
+        self._players = players
+        self._verbose = verbose
+        self._boards = []
+        # стрелки игроков по доскам соперников, создаются при первом выстреле по доске
+        self._shooters = [{} for i in range(players)]
+        self.turns = 0
+
+    def start_game(self) -> int:
+        '''Проводит игру и возвращает номер победителя.'''
+        self._setup()
+        scheduler = TurnScheduler(self._players, self._rng.spawn())
+
+        while scheduler.alive > 1:
+            player = scheduler.current
+            target = scheduler.random_opponent(player)
+            board = self._boards[target]
+            shooter = self._shooter(player, target)
+            # по доске стреляют несколько соперников, стрелок пропускает ячейки,
+            # которые уже исключены из кандидатов доски
+            coords = shooter.shoot()
+            self.turns += 1
+
+            if not board.process_shot(coords[0], coords[1]):
+                scheduler.advance()
+            elif board.all_ships_are_sunken:
+                scheduler.eliminate(target)
+
+                if self._verbose:
+                    print(f'Игрок {player + 1} потопил все корабли игрока {target + 1}.')
+
+        winner = scheduler.current
+
+        if self._verbose:
+            print(f'Победил игрок {winner + 1}. Сделано выстрелов: {self.turns}.')
+
+        return winner
+
+    def _setup(self) -> None:
+        '''Формирует и заполняет доски игроков.'''
+        for i in range(self._players):
+            attempt = self._attempt
+
+            while True:
+                try:
+                    board = self._create_board(display_ships=False)
+                    break
+                except BoardCreationError as e:
+                    if not attempt:
+                        print(e)
+                        sys.exit()
+                    attempt -= 1
+
+            board.verbose = False
+            self._boards.append(board)
+
+    def _shooter(self, player: int, target: int) -> AIPlayer:
+        '''Возвращает стрелка игрока по доске соперника.
+
+        Аргументы:
+        player - номер игрока.
+        target - номер соперника.
+        '''
+        shooters = self._shooters[player]
+
+        if target not in shooters:
+            board = self._boards[target]
+            shooters[target] = AIPlayer(board.min + 1, board.max + 1, self._rng.spawn(),
+                                        candidates=board.unknown_cells)
+        return shooters[target]
+
+    def print_boards(self) -> None:
+        '''Печатает доски игроков в консоль.'''
+        for i, board in enumerate(self._boards):
+            print()
+            print(f'Доска игрока {i + 1}:')
+            board.print()
+        print()
+
+
+if __name__ == '__main__':
+    controller = BattleController(3, seed=5, verbose=True)
+    winner = controller.start_game()
+    controller.print_boards()
+
+    assert not controller._boards[winner].all_ships_are_sunken
+    assert sum(not board.all_ships_are_sunken for board in controller._boards) == 1
+
+    # игра с одинаковым зерном повторяется полностью
+    assert BattleController(3, seed=5).start_game() == winner
+
+    controller = BattleController(150, seed=1)
+    winner = controller.start_game()
+
+    assert sum(not board.all_ships_are_sunken for board in controller._boards) == 1
+    print(f'150 игроков: победил игрок {winner + 1}, выстрелов {controller.turns}.')
+
+    # с отметкой ячеек вокруг потопленных кораблей игры короче
+    turns = [0, 0]
+    for seed in range(20):
+        for reveal_halo in (False, True):
+            controller = BattleController(3, seed=seed, reveal_halo=reveal_halo)
+            controller.start_game()
+            turns[reveal_halo] += controller.turns
+
+    assert turns[True] < turns[False]
+    print(f'Выстрелов без отметки: {turns[False]}, с отметкой: {turns[True]}.')
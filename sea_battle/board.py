@@ -0,0 +1,900 @@
+from copy import copy
+from .errors import (ShipExistsError, ChangeForbiddenError, CellsAllocationError,
+                     ShipDislocationAreaError, ShootError, CellCoordsError, UndoError)
+from .cell import Cell
+from .ship import Ship
+
+
+class Board:
+    '''Класс описывающий доску.
+
+    Аргументы:
+    display_ships - индикатор того, что нужно отображать корабли на доске.
+    show_boundary - индикатор необходимости отображать границу вокруг корабля.
+    verbose - индикатор того, что результат выстрела нужно выводить в консоль.
+    reveal_halo - индикатор того, что ячейки вокруг потопленного корабля
+    сразу отмечаются как промахи.
+
+    Атрибуты экземпляра:
+    min - минимально допустимая координата ячейки по оси X.
+    max - максимально допустимая координата ячейки по оси Y.
+    all_ships_are_sunken - индикатор потопления всех кораблей.
+    all_cells_are_shot - индикатор того, что по всем ячейкам были произведены выстрелы.
+    unknown_cells - координаты ячеек, по которым еще имеет смысл стрелять.
+
+    Методы экземпляра:
+    add_ship(ship: Ship) - добавить корабль на доску.
+    placement_candidates(length: int) - вернуть все варианты размещения корабля.
+    check_placements(candidates: list) - проверить допустимость вариантов размещения кораблей.
+    process_shot(x: int, y: int) - обрабатывает выстрел по ячейке доски.
+    undo_shot - отменяет последний выстрел.
+    clone - возвращает копию доски, которая копирует состояние только при изменении.
+    hit_cells - возвращает координаты ячеек, по которым было попадание.
+    cell_is_shot(x: int, y: int) - проверяет, был ли выстрел по ячейке.
+    add_observer(callback) - подписать функцию на изменения доски.
+    remove_observer(callback) - отписать функцию от изменений доски.
+    print - вывести доску в консоль.
+    '''
+    _from = 0
+    _to = 6
+
+    def __init__(self, display_ships: bool = True, show_boundary: bool = False,
+                 verbose: bool = True, reveal_halo: bool = False) -> None:
+
+        self._cells = [[Cell(i, j) for i in range(self._from, self._to)]
+                       for j in range(self._from, self._to)]
+
+        self.display_ships = display_ships
+        self.show_boundary = show_boundary
+        self.verbose = verbose
+        self.reveal_halo = reveal_halo
+        self._ships = []
+        # счетчики кораблей на плаву и выстрелов, поддерживаются при каждом изменении доски,
+        # поэтому проверка окончания игры не требует обхода ячеек и кораблей
+        self._afloat = 0
+        self._shots = 0
+        # ячейки, по которым еще не стреляли, в системе координат пользователя
+        self._unknown = {(x, y)
+                         for x in range(self._from + 1, self._to + 1)
+                         for y in range(self._from + 1, self._to + 1)}
+        # стек выстрелов вида (строка, столбец, индекс корабля или None,
+        # ячейки, отмеченные вокруг потопленного корабля) для их отмены
+        self._history = []
+        # строки ячеек и корабли, которые принадлежат только этой доске;
+        # остальные разделяются с копиями и копируются перед изменением
+        self._owned_rows = set(range(len(self._cells)))
+        self._owned_ships = set()
+        # индекс корабля по индексам (строка, столбец) занятой им ячейки,
+        # поэтому выстрел находит корабль без обхода списка кораблей
+        self._owners = {}
+        # функции вида callback(x, y, outcome, sunk), которые вызываются при изменении ячейки
+        self._observers = []
+
+    @property
+    def min(self) -> int:
+        '''Минимально допустимая координата ячейки.'''
+        return self._from
+
+    @min.setter
+    def min(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def max(self) -> int:
+        '''Максимально допустимая координата ячейки.'''
+        return self._to - 1
+
+    @max.setter
+    def max(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def all_cells_are_shot(self) -> bool:
+        '''Индикатор того, что по всем ячейкам были произведены выстрелы.'''
+        return self._shots == (self._to * self._to)
+
+    @all_cells_are_shot.setter
+    def all_cells_are_shot(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def all_ships_are_sunken(self) -> bool:
+        '''Индикатор потопления всех кораблей.'''
+        return not self._afloat
+
+    @all_ships_are_sunken.setter
+    def all_ships_are_sunken(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def unknown_cells(self) -> set[tuple[int, int]]:
+        '''Координаты ячеек, по которым еще имеет смысл стрелять, в системе координат пользователя.
+        Множество поддерживается доской при каждом выстреле и не должно изменяться снаружи.'''
+        return self._unknown
+
+    @unknown_cells.setter
+    def unknown_cells(self, value) -> None:
+        raise ChangeForbiddenError
+
+    def add_ship(self, ship: Ship) -> None:
+        '''Добавить корабль на доску.
+
+        Аргументы:
+        ship - экземпляр класса корабля.
+        '''
+        if ship in self._ships:
+            raise ShipExistsError
+
+        ship_cells, ship_boundary_cells = self._allocate_cells(ship)
+
+        if len(ship_cells) < ship.length:
+            raise CellsAllocationError
+
+        if not self._area_is_acceptable(ship_cells + ship_boundary_cells):
+            raise ShipDislocationAreaError
+
+        ship.cells = [self._writable_cell(cell.y, cell.x) for cell in ship_cells]
+        ship.boundary_cells = ship_boundary_cells
+        self._ships.append(ship)
+        self._owned_ships.add(len(self._ships) - 1)
+        self._afloat += 1
+
+        for cell in ship.cells:
+            self._owners[(cell.y, cell.x)] = len(self._ships) - 1
+            cell.occupied = True
+
+            if self.display_ships:
+                cell.displayed = True
+
+        if self.show_boundary:
+            for cell in ship_boundary_cells:
+                self._writable_cell(cell.y, cell.x).boundary = True
+
+    def placement_candidates(self, length: int) -> list[tuple[dict, int, bool]]:
+        '''Возвращает все варианты размещения корабля заданной длины в виде
+        кортежей (нос корабля, длина, горизонтальное расположение).
+        Однопалубный корабль перечисляется только в горизонтальном расположении.
+
+        Аргументы:
+        length - длина корабля.
+        '''
+        orientations = (True, False) if length > 1 else (True,)
+        return [({'x': x, 'y': y}, length, horizontal)
+                for x in range(self._from, self._to)
+                for y in range(self._from, self._to)
+                for horizontal in orientations]
+
+    def check_placements(self, candidates: list[tuple[dict, int, bool]] = None,
+                         length: int = 1) -> list[bool]:
+        '''Проверяет допустимость вариантов размещения кораблей без выбрасывания исключений.
+        Возвращает список булевых значений в порядке вариантов. Результат совпадает
+        с тем, примет ли add_ship соответствующий корабль.
+
+        Аргументы:
+        candidates - список кортежей (нос корабля, длина, горизонтальное расположение).
+        Если не указан, проверяются все варианты из placement_candidates(length).
+        length - длина корабля для проверки всех вариантов.
+        '''
+        if candidates is None:
+            candidates = self.placement_candidates(length)
+
+        size = self._to - self._from
+        # ячейка свободна, если ни она, ни ее соседи не заняты кораблем
+        free = [[True] * size for i in range(size)]
+
+        for ship in self._ships:
+            for cell in ship.cells:
+                for row in range(cell.y - 1, cell.y + 2):
+                    for col in range(cell.x - 1, cell.x + 2):
+                        if 0 <= row < size and 0 <= col < size:
+                            free[row][col] = False
+
+        # количество свободных ячеек подряд вправо и вниз от каждой ячейки
+        runs_right = [[0] * (size + 1) for i in range(size + 1)]
+        runs_down = [[0] * (size + 1) for i in range(size + 1)]
+
+        for row in range(size - 1, -1, -1):
+            for col in range(size - 1, -1, -1):
+                if free[row][col]:
+                    runs_right[row][col] = runs_right[row][col + 1] + 1
+                    runs_down[row][col] = runs_down[row + 1][col] + 1
+
+        result = []
+        for bow, ship_length, horizontal in candidates:
+            row, col = bow['x'], bow['y']
+
+            if 0 <= row < size and 0 <= col < size:
+                runs = runs_right if horizontal else runs_down
+                result.append(runs[row][col] >= ship_length)
+            else:
+                result.append(False)
+        return result
+
+    def _allocate_cells(self, ship: Ship) -> tuple[list[Cell], list[Cell]]:
+        '''Возвращает кортеж, в котором первый элемент это список ячеек доски,
+        которые отводятся под корабль, а второй - список ячеек, которые к ниму примыкают.
+
+        Аргументы:
+        ship - экземпляр класса корабля.
+        '''
+        ship_cells = []
+        ship_boundary_cells = []
+
+        # отрицательный индекс указывал бы на ячейку у противоположного края доски
+        if ship.bow['x'] < 0 or ship.bow['y'] < 0:
+            return ship_cells, ship_boundary_cells
+
+        if ship.horizontal:
+            try:
+                for y in range(ship.bow['y'], ship.bow['y'] + ship.length):
+                    cell = self._cells[ship.bow['x']][y]
+                    ship_cells.append(cell)
+            except IndexError:
+                pass
+
+            if len(ship_cells):
+                i_start = -1 if ship.bow['x'] > 0 else 0
+
+                for i in range(i_start, 2):
+                    y_start = ship.bow['y'] - 1 if (ship.bow['y'] - 1) > 0 else 0
+
+                    for y in range(y_start, ship.bow['y'] + ship.length + 1):
+                        try:
+                            cell = self._cells[ship.bow['x'] + i][y]
+                            if cell not in ship_cells:
+                                ship_boundary_cells.append(cell)
+                        except IndexError:
+                            pass
+        else:
+            try:
+                for x in range(ship.bow['x'], ship.bow['x'] + ship.length):
+                    cell = self._cells[x][ship.bow['y']]
+                    ship_cells.append(cell)
+            except IndexError:
+                pass
+
+            if len(ship_cells):
+                i_start = -1 if ship.bow['y'] > 0 else 0
+
+                for i in range(i_start, 2):
+                    x_start = ship.bow['x'] - 1 if (ship.bow['x'] - 1) > 0 else 0
+
+                    for x in range(x_start, ship.bow['x'] + ship.length + 1):
+                        try:
+                            cell = self._cells[x][ship.bow['y'] + i]
+                            if cell not in ship_cells:
+                                ship_boundary_cells.append(cell)
+                        except IndexError:
+                            pass
+
+        return ship_cells, ship_boundary_cells
+
+    @staticmethod
+    def _area_is_acceptable(area_cells: list[Cell]) -> bool:
+        '''Проверяет является ли область на доске допустимой для размещения корабля.
+
+        Аргументы:
+        area_cells - список ячеек проверяемой области.
+        '''
+        for cell in area_cells:
+            if cell.occupied:
+                return False
+        return True
+
+    def process_shot(self, x: int, y: int) -> bool:
+        '''Обрабатывает выстрел по ячейке доски.
+        В качестве значения выозвращает булево значение указывающее на успешность выстрела.
+
+        Аргументы:
+        x - координата ячейки по оси X.
+        y - координата ячейки по оси Y.
+        '''
+        _min = self.min + 1
+        _max = self.max + 1
+
+        if x < _min or x > _max:
+            raise CellCoordsError(f'''Координата "x" должна быть от {_min} до {_max}''')
+
+        elif y < _min or y > _max:
+            raise CellCoordsError(f'''Координата "y" должна быть от {_min} до {_max}''')
+
+        # система координат пользователя начинается с 1
+        row, col = x - 1, y - 1
+
+        if self._cells[row][col].shot:
+            raise ShootError
+
+        cell = self._writable_cell(row, col)
+        cell.shot = True
+        self._shots += 1
+        self._unknown.discard((x, y))
+
+        index = self._owners.get((row, col))
+
+        if index is None:
+            self._history.append((row, col, None, ()))
+            self._notify(x, y, 'miss')
+
+            if self.verbose:
+                print('МИМО!!!')
+            return False
+
+        cell.missed = False
+        ship = self._writable_ship(index)
+        ship.damage(ship.segment_of(row, col))
+        halo = ()
+
+        if ship.sunken:
+            self._afloat -= 1
+            self._notify(x, y, 'sunk', ship)
+
+            if self.reveal_halo:
+                halo = self._reveal_halo(ship)
+        else:
+            self._notify(x, y, 'hit')
+
+        self._history.append((row, col, index, halo))
+
+        if self.verbose:
+            if ship.sunken:
+                print('ПОТОПИЛ!!!')
+            else:
+                print('ПОПАЛ!!!')
+
+        return True
+
+    def undo_shot(self) -> None:
+        '''Отменяет последний выстрел, сделанный по этой доске.'''
+        if not self._history:
+            raise UndoError
+
+        row, col, index, halo = self._history.pop()
+
+        for halo_row, halo_col in halo:
+            self._writable_cell(halo_row, halo_col).shot = False
+            self._shots -= 1
+            self._unknown.add((halo_row + 1, halo_col + 1))
+            self._notify(halo_row + 1, halo_col + 1, None)
+
+        cell = self._writable_cell(row, col)
+        cell.shot = False
+        cell.missed = True
+        self._shots -= 1
+        self._unknown.add((row + 1, col + 1))
+
+        if index is not None:
+            ship = self._writable_ship(index)
+
+            if ship.sunken:
+                self._afloat += 1
+
+            ship.repair(ship.segment_of(row, col))
+
+        self._notify(row + 1, col + 1, None)
+
+    def _reveal_halo(self, ship: Ship) -> tuple[tuple[int, int], ...]:
+        '''Отмечает ячейки вокруг потопленного корабля как промахи и
+        возвращает индексы (строка, столбец) ячеек, которые были отмечены.
+
+        Аргументы:
+        ship - потопленный корабль.
+        '''
+        halo = []
+
+        for boundary_cell in ship.boundary_cells:
+            row, col = boundary_cell.y, boundary_cell.x
+
+            if self._cells[row][col].shot:
+                continue
+
+            self._writable_cell(row, col).shot = True
+            self._shots += 1
+            self._unknown.discard((row + 1, col + 1))
+            halo.append((row, col))
+            self._notify(row + 1, col + 1, 'halo')
+
+        return tuple(halo)
+
+    def add_observer(self, callback) -> None:
+        '''Подписать функцию на изменения доски.
+        Функция вызывается с аргументами x, y, outcome, sunk, где x и y - координаты
+        ячейки в системе координат пользователя, outcome - 'miss', 'hit', 'sunk',
+        'halo' для ячейки, отмеченной вокруг потопленного корабля, или None
+        при отмене выстрела, sunk - координаты ячеек потопленного корабля.
+
+        Аргументы:
+        callback - подписываемая функция.
+        '''
+        self._observers.append(callback)
+
+    def remove_observer(self, callback) -> None:
+        '''Отписать функцию от изменений доски.
+
+        Аргументы:
+        callback - ранее подписанная функция.
+        '''
+        self._observers.remove(callback)
+
+    def _notify(self, x: int, y: int, outcome: str, ship: Ship = None) -> None:
+        '''Сообщить подписчикам об изменении ячейки.
+
+        Аргументы:
+        x - координата ячейки по оси X в системе координат пользователя.
+        y - координата ячейки по оси Y в системе координат пользователя.
+        outcome - результат выстрела.
+        ship - потопленный корабль.
+        '''
+        if not self._observers:
+            return
+
+        sunk = tuple((cell.y + 1, cell.x + 1) for cell in ship.cells) if ship is not None else None
+
+        for callback in self._observers:
+            callback(x, y, outcome, sunk)
+
+    def clone(self) -> 'Board':
+        '''Возвращает копию доски.
+        Копия разделяет строки ячеек и корабли с исходной доской, а каждая
+        из досок копирует строку или корабль только перед их изменением.
+        Множество unknown_cells и индекс кораблей по ячейкам копируются сразу:
+        на множество ссылаются стрелки доски, поэтому подменять его при изменении
+        нельзя. Стоимость копирования пропорциональна количеству строк, кораблей,
+        занятых и еще не обстрелянных ячеек, то есть не больше размера доски.
+        Стек отмены и список подписчиков копии начинаются с пустых,
+        а списки ячеек кораблей описывают только их положение.'''
+        board = copy(self)
+        board._cells = list(self._cells)
+        board._ships = list(self._ships)
+        board._history = []
+        board._owned_rows = set()
+        board._owned_ships = set()
+        board._observers = []
+        board._unknown = set(self._unknown)
+        board._owners = dict(self._owners)
+        self._owned_rows = set()
+        self._owned_ships = set()
+        return board
+
+    def hit_cells(self) -> list[tuple[int, int]]:
+        '''Возвращает координаты ячеек, по которым было попадание,
+        в системе координат пользователя.'''
+        return [(cell.y + 1, cell.x + 1)
+                for cells_row in self._cells
+                for cell in cells_row
+                if cell.shot and not cell.missed]
+
+    def cell_is_shot(self, x: int, y: int) -> bool:
+        '''Проверяет, был ли выстрел по ячейке.
+
+        Аргументы:
+        x - координата ячейки по оси X в системе координат пользователя.
+        y - координата ячейки по оси Y в системе координат пользователя.
+        '''
+        return self._cells[x - 1][y - 1].shot
+
+    def _writable_cell(self, row: int, col: int) -> Cell:
+        '''Возвращает ячейку, принадлежащую только этой доске, копируя ее строку при необходимости.
+
+        Аргументы:
+        row - индекс строки ячейки.
+        col - индекс столбца ячейки.
+        '''
+        if row not in self._owned_rows:
+            self._cells[row] = [copy(cell) for cell in self._cells[row]]
+            self._owned_rows.add(row)
+        return self._cells[row][col]
+
+    def _writable_ship(self, index: int) -> Ship:
+        '''Возвращает корабль, принадлежащий только этой доске, копируя его при необходимости.
+
+        Аргументы:
+        index - индекс корабля в списке кораблей доски.
+        '''
+        if index not in self._owned_ships:
+            self._ships[index] = self._ships[index].copy()
+            self._owned_ships.add(index)
+        return self._ships[index]
+
+    def print(self) -> None:
+        '''Вывести доску в консоль.'''
+        print('  | 1 | 2 | 3 | 4 | 5 | 6 ')
+        for i in range(self._from + 1, self._to + 1):
+            print(f'{i} | {" | ".join(map(str, self._cells[i - 1]))}')
+
+
+if __name__ == '__main__':
+    # ------------------------ Экземпляр класса ------------------------
+    board = Board()
+    min = board.min
+    max = board.max
+    all_ships_are_sunken = board.all_ships_are_sunken
+    all_cells_are_shot = board.all_cells_are_shot
+
+    try:
+        board.min = 123
+    except ChangeForbiddenError:
+        pass
+
+    try:
+        board.max = 123
+    except ChangeForbiddenError:
+        pass
+
+    try:
+        board.all_ships_are_sunken = 'True'
+    except ChangeForbiddenError:
+        pass
+
+    try:
+        board.all_cells_are_shot = 123
+    except ChangeForbiddenError:
+        pass
+
+    assert board.min == min
+    assert board.max == max
+    assert board.all_ships_are_sunken == all_ships_are_sunken
+    assert board.all_cells_are_shot == all_cells_are_shot
+
+    # ------------------------ Отображение доски ------------------------
+    # длина корабля
+    # если выйдет за пределы доски будет выбражено исключение
+    ship_length = 1
+    # индикатор необходимости выделить точки примыкающие к кораблю (B)
+    show_boundary = True
+
+    print()
+
+    coords = [(0, 0), (1, 0), (1, 1), (0, 1),
+              (0, 5), (1, 5), (1, 4), (0, 4),
+              (5, 0), (5, 5), (2, 2), (1, 3)]
+
+    for coord in coords:
+        print('=' * 50)
+        print(f'Координаты носа корабля: {coord}. Длина корабля: {ship_length}.')
+        print()
+        board = Board(show_boundary=show_boundary)
+        ship = Ship({'x': coord[0], 'y': coord[1]}, ship_length)
+        board.add_ship(ship)
+        board.print()
+        print()
+
+    print('=' * 50)
+    print('Координаты носа корабля: (1, 3). Длина корабля: 3.')
+    print('Вертикальный вариант.')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship = Ship({'x': 1, 'y': 3}, 3, horizontal=False)
+    board.add_ship(ship)
+    board.print()
+    print()
+
+    print()
+
+    print('=' * 50)
+    print('Координаты носа корабля: (0, 0). Длина корабля: 3.')
+    print('Корабль не отображен.')
+    print()
+    board = Board(display_ships=False)
+    ship = Ship({'x': 0, 'y': 0}, 3)
+    board.add_ship(ship)
+    board.print()
+
+    print()
+
+    print('=' * 50)
+    print('Координаты носа корабля: (1, 3). Длина корабля: 6.')
+    print('Корабль выходит за пределы доски. Должно быть выбрашено исключение.')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship = Ship({'x': 1, 'y': 3}, 6)
+    try:
+        board.add_ship(ship)
+        board.print()
+    except CellsAllocationError as e:
+        print(f'Исключение: "{e}"')
+    print()
+
+    print('=' * 50)
+    print('Координаты носа первого корабля: (1, 1). Длина корабля: 3.')
+    print('Координаты носа второго корабля: (3, 2). Длина корабля: 1.')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship_1 = Ship({'x': 1, 'y': 1}, 3)
+    ship_2 = Ship({'x': 3, 'y': 2}, 1)
+    board.add_ship(ship_1)
+    board.add_ship(ship_2)
+    board.print()
+
+    print()
+
+    print('=' * 50)
+    print('Координаты носа первого корабля: (1, 1). Длина корабля: 3.')
+    print('Координаты носа второго корабля: (1, 1). Длина корабля: 1.')
+    print('Корабли пересекаются. Должно быть выбрашено исключение.')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship_1 = Ship({'x': 1, 'y': 1}, 3)
+    ship_2 = Ship({'x': 1, 'y': 1}, 1)
+    try:
+        board.add_ship(ship_1)
+        board.add_ship(ship_2)
+        board.print()
+    except ShipDislocationAreaError as e:
+        print(f'Исключение: "{e}"')
+    print()
+
+    print('=' * 50)
+    print('Координаты носа первого корабля: (1, 1). Длина корабля: 3.')
+    print('Координаты носа второго корабля: (2, 1). Длина корабля: 1.')
+    print('Корабли соприкасаются по вертикали. Должно быть выбрашено исключение.')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship_1 = Ship({'x': 1, 'y': 1}, 3)
+    ship_2 = Ship({'x': 2, 'y': 1}, 1)
+    try:
+        board.add_ship(ship_1)
+        board.add_ship(ship_2)
+        board.print()
+    except ShipDislocationAreaError as e:
+        print(f'Исключение: "{e}"')
+    print()
+
+    print('=' * 50)
+    print('Координаты носа первого корабля: (1, 1). Длина корабля: 3.')
+    print('Координаты носа второго корабля: (1, 4). Длина корабля: 1.')
+    print('Корабли соприкасаются по горизонтали. Должно быть выбрашено исключение.')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship_1 = Ship({'x': 1, 'y': 1}, 3)
+    ship_2 = Ship({'x': 1, 'y': 4}, 1)
+    try:
+        board.add_ship(ship_1)
+        board.add_ship(ship_2)
+        board.print()
+    except ShipDislocationAreaError as e:
+        print(f'Исключение: "{e}"')
+    print()
+
+    print('=' * 50)
+    print('Координаты носа корабля: (0, 0). Длина корабля: 3.')
+    print('Выстрел в точку с координатами: (0, 0).')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship = Ship({'x': 0, 'y': 0}, 3)
+    board.add_ship(ship)
+    # система координат для пользователя начинается с 1
+    board.process_shot(1, 1)
+    board.print()
+
+    print('=' * 50)
+    print('Координаты носа корабля: (0, 0). Длина корабля: 3.')
+    print('Выстрел в точки с координатами: (0, 0), (0, 1), (0, 2).')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship = Ship({'x': 0, 'y': 0}, 3)
+    board.add_ship(ship)
+    # система координат для пользователя начинается с 1
+    board.process_shot(1, 1)
+    board.process_shot(1, 2)
+    board.process_shot(1, 3)
+    board.print()
+
+    print('=' * 50)
+    print('Координаты носа корабля: (0, 0). Длина корабля: 3.')
+    print('Повторный выстрел в точку с координатами: (0, 0).  Должно быть выбрашено исключение.')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship = Ship({'x': 0, 'y': 0}, 3)
+    board.add_ship(ship)
+    try:
+        # система координат для пользователя начинается с 1
+        board.process_shot(1, 1)
+        board.process_shot(1, 1)
+    except ShootError as e:
+        print(e)
+    board.print()
+
+    print('=' * 50)
+    print('Координаты носа корабля: (0, 0). Длина корабля: 3.')
+    print('Выстрел в точку с координатами: (2, 4).')
+    print()
+    board = Board(show_boundary=show_boundary)
+    ship = Ship({'x': 0, 'y': 0}, 3)
+    board.add_ship(ship)
+    # система координат для пользователя начинается с 1
+    board.process_shot(2, 4)
+    board.print()
+
+    print()
+
+    print('=' * 50)
+    print('Выстрел в точку с координатами: (-1, 4).')
+    print()
+    board = Board()
+    try:
+        # система координат для пользователя начинается с 1
+        board.process_shot(-1, 4)
+        board.print()
+    except CellCoordsError as e:
+        print(e)
+
+    print()
+
+    print('=' * 50)
+    print('Выстрел в точку с координатами: (1, 14).')
+    print()
+    board = Board()
+    try:
+        # система координат для пользователя начинается с 1
+        board.process_shot(1, 14)
+        board.print()
+    except CellCoordsError as e:
+        print(e)
+
+    print()
+
+    print('=' * 50)
+    print('Проверка на потопляемость кораблей.')
+    print()
+    board = Board()
+    ship_1 = Ship({'x': 0, 'y': 0}, 1)
+    ship_2 = Ship({'x': 0, 'y': 5}, 1)
+    ship_3 = Ship({'x': 5, 'y': 0}, 1)
+    ship_4 = Ship({'x': 5, 'y': 5}, 1)
+    board.add_ship(ship_1)
+    board.add_ship(ship_2)
+    board.add_ship(ship_3)
+    board.add_ship(ship_4)
+
+    if not board.all_ships_are_sunken:
+        print('Еще есть на плаву.')
+
+    # система координат для пользователя начинается с 1
+    board.process_shot(1, 1)
+
+    if not board.all_ships_are_sunken:
+        print('Еще есть на плаву.')
+
+    board.process_shot(1, 6)
+
+    if not board.all_ships_are_sunken:
+        print('Еще есть на плаву.')
+
+    board.process_shot(6, 1)
+
+    if not board.all_ships_are_sunken:
+        print('Еще есть на плаву.')
+
+    board.process_shot(6, 6)
+
+    if not board.all_ships_are_sunken:
+        print('Еще есть на плаву.')
+
+    if board.all_ships_are_sunken:
+        print('Все потоплены.')
+
+    print()
+
+    # ------------------------ Копирование и отмена выстрелов ------------------------
+    board = Board(verbose=False)
+    board.add_ship(Ship({'x': 0, 'y': 0}, 2))
+    board.add_ship(Ship({'x': 3, 'y': 3}, 1))
+    board.process_shot(1, 1)
+
+    board_clone = board.clone()
+    board_clone.process_shot(1, 2)
+    board_clone.process_shot(4, 4)
+
+    assert board_clone.all_ships_are_sunken
+    assert not board.all_ships_are_sunken
+    assert not board._cells[0][1].shot
+
+    board.process_shot(6, 6)
+
+    assert not board_clone._cells[5][5].shot
+
+    board_clone.undo_shot()
+    board_clone.undo_shot()
+
+    assert not board_clone.all_ships_are_sunken
+    assert not board_clone._cells[0][1].shot
+    assert board_clone._cells[0][0].shot
+
+    try:
+        board_clone.undo_shot()
+    except UndoError:
+        pass
+    else:
+        raise AssertionError
+
+    board.undo_shot()
+    board.undo_shot()
+
+    assert not board._cells[0][0].shot
+    assert board_clone._cells[0][0].shot
+    assert board_clone.hit_cells() == [(1, 1)]
+
+    # ------------------------ Проверка вариантов размещения ------------------------
+    board = Board(verbose=False)
+    board.add_ship(Ship({'x': 0, 'y': 0}, 3, horizontal=False))
+    board.add_ship(Ship({'x': 2, 'y': 3}, 2))
+
+    for length in range(1, 5):
+        candidates = board.placement_candidates(length)
+        legal = board.check_placements(candidates)
+
+        assert legal == board.check_placements(length=length)
+
+        for (bow, ship_length, horizontal), ok in zip(candidates, legal):
+            try:
+                board.clone().add_ship(Ship(bow, ship_length, horizontal))
+                accepted = True
+            except (CellsAllocationError, ShipDislocationAreaError):
+                accepted = False
+
+            assert ok == accepted
+
+    assert board.check_placements([({'x': -1, 'y': 0}, 1, True), ({'x': 5, 'y': 5}, 1, True)]) == [False, True]
+
+    for bow in ({'x': -1, 'y': 0}, {'x': 5, 'y': -1}):
+        try:
+            board.clone().add_ship(Ship(bow, 1))
+        except CellsAllocationError:
+            pass
+        else:
+            raise AssertionError
+
+    # ------------------------ Проверка отметки ячеек вокруг потопленного корабля ------------------------
+    board = Board(verbose=False, reveal_halo=True)
+    board.add_ship(Ship({'x': 1, 'y': 1}, 2))
+    events = []
+    board.add_observer(lambda x, y, outcome, sunk: events.append((x, y, outcome)))
+
+    board.process_shot(2, 2)
+    board.process_shot(2, 3)
+
+    halo = {(x, y) for x in range(1, 4) for y in range(1, 5)} - {(2, 2), (2, 3)}
+
+    assert board.all_ships_are_sunken
+    assert {(x, y) for x, y, outcome in events if outcome == 'halo'} == halo
+    assert all(board.cell_is_shot(x, y) for x, y in halo)
+    assert len(board.unknown_cells) == 36 - 12
+    assert board._shots == 12
+
+    try:
+        board.process_shot(1, 1)
+    except ShootError:
+        pass
+    else:
+        raise AssertionError
+
+    board_clone = board.clone()
+    board.undo_shot()
+
+    assert len(board.unknown_cells) == 36 - 1
+    assert board._shots == 1
+    assert not any(board.cell_is_shot(x, y) for x, y in halo)
+    assert len(board_clone.unknown_cells) == 36 - 12
+    assert board_clone.cell_is_shot(1, 1)
+
+    # ------------------------ Проверка маски повреждений корабля ------------------------
+    board = Board(verbose=False)
+    board.add_ship(Ship({'x': 1, 'y': 1}, 3, horizontal=False))
+    board_clone = board.clone()
+    board.process_shot(4, 2)
+    board.process_shot(2, 2)
+
+    assert board._ships[0].hit_mask == 0b101
+    assert board._ships[0].remaining_segments == [1]
+    assert board._ships[0].known_orientation is False
+    assert board_clone._ships[0].hit_mask == 0
+
+    board.undo_shot()
+
+    assert board._ships[0].hit_mask == 0b100
+    assert board._ships[0].known_orientation is None
+
+    board_clone.add_ship(Ship({'x': 5, 'y': 5}, 1))
+
+    assert board_clone.process_shot(6, 6) and board_clone.all_ships_are_sunken is False
+    assert not board.process_shot(6, 6)
@@ -0,0 +1,316 @@
+from multiprocessing import resource_tracker, shared_memory
+import struct
+import sys
+from weakref import WeakSet
+from .board import Board
+from .board_view import BoardView
+from .ship import Ship
+
+
+class BoardArena:
+    '''Класс описывающий арену досок в общей памяти.
+
+    Доски хранятся записями фиксированного размера в одном блоке
+    multiprocessing.shared_memory. Процессы подключаются к арене по имени
+    и работают с досками через представления BoardView без копирования
+    и сериализации.
+
+    Формат записи доски:
+    4 байта заголовка - количество кораблей, количество кораблей на плаву,
+    количество выстрелов, признаки доски (бит 0 - display_ships, бит 1 - show_boundary,
+    бит 2 - reveal_halo);
+    байт состояния каждой ячейки, см. BoardView;
+    байт номера корабля каждой ячейки, 0 - ячейка свободна;
+    5 байт каждого корабля - нос по оси X, нос по оси Y, длина, горизонтальность,
+    битовая маска поврежденных частей.
+
+    Аргументы:
+    capacity - количество досок в новой арене.
+    name - имя существующей арены для подключения к ней.
+    max_ships - максимальное количество кораблей на доске в новой арене.
+
+    Атрибуты экземпляра:
+    name - имя блока общей памяти.
+    capacity - количество досок в арене.
+
+    Методы экземпляра:
+    store(index: int, board: Board) - записать доску в арену.
+    view(index: int) - вернуть представление доски без копирования.
+    load(index: int) - восстановить из записи экземпляр класса доски.
+    close - отключиться от арены.
+    unlink - удалить блок общей памяти.
+    '''
+    # заголовок арены: количество досок, размер доски, максимальное количество кораблей
+    _header = struct.Struct('<IBB')
+    _ship_size = 5
+    # имена арен, созданных этим процессом или его предком до fork
+    _created = set()
+
+    def __init__(self, capacity: int = None, name: str = None, max_ships: int = 7) -> None:
+        if name is None:
+            size = Board._to - Board._from
+            layout = self._make_layout(size, max_ships)
+            self._shm = shared_memory.SharedMemory(create=True,
+                                                   size=self._header.size + capacity * layout['record'])
+            self._header.pack_into(self._shm.buf, 0, capacity, size, max_ships)
+            self._created.add(self._shm.name)
+        else:
+            self._shm = self._attach(name)
+            capacity, size, max_ships = self._header.unpack_from(self._shm.buf, 0)
+            layout = self._make_layout(size, max_ships)
+
+        self.capacity = capacity
+        self._layout = layout
+        self._max_ships = max_ships
+        # представления держат ссылки на буфер, их нужно освободить перед отключением
+        self._views = WeakSet()
+
+    @classmethod
+    def _attach(cls, name: str) -> shared_memory.SharedMemory:
+        '''Подключается к существующему блоку общей памяти так, чтобы выход
+        подключившегося процесса не удалял блок.
+
+        До Python 3.13 SharedMemory регистрирует блок в трекере ресурсов процесса,
+        и трекер удаляет его при выходе процесса. Регистрация снимается, если трекер
+        принадлежит только этому процессу. Процессы, запущенные через multiprocessing,
+        разделяют трекер с создателем арены, и снятие регистрации лишило бы
+        создателя защиты от утечки блока.
+
+        Аргументы:
+        name - имя блока общей памяти.
+        '''
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+
+        tracker = resource_tracker._resource_tracker
+        # трекер передан при запуске через spawn или унаследован через fork вместе с именем арены
+        shared_tracker = (tracker._pid is None and tracker._fd is not None) or name in cls._created
+        shm = shared_memory.SharedMemory(name=name)
+
+        if not shared_tracker:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+    @property
+    def name(self) -> str:
+        '''Имя блока общей памяти.'''
+        return self._shm.name
+
+    @classmethod
+    def _make_layout(cls, size: int, max_ships: int) -> dict:
+        '''Возвращает смещения полей записи доски.
+
+        Аргументы:
+        size - размер стороны доски.
+        max_ships - максимальное количество кораблей на доске.
+        '''
+        cells = 4
+        owners = cells + size * size
+        ships = owners + size * size
+        return {
+            'size': size, 'count': 0, 'afloat': 1, 'shots': 2, 'flags': 3,
+            'cells': cells, 'owners': owners, 'ships': ships, 'ship_size': cls._ship_size,
+            'record': ships + max_ships * cls._ship_size,
+        }
+
+    def _record(self, index: int) -> memoryview:
+        '''Возвращает срез буфера с записью доски.
+
+        Аргументы:
+        index - номер доски в арене.
+        '''
+        if not 0 <= index < self.capacity:
+            raise IndexError('Номер доски вне арены.')
+
+        start = self._header.size + index * self._layout['record']
+        return self._shm.buf[start:start + self._layout['record']]
+
+    def store(self, index: int, board: Board) -> None:
+        '''Записать доску в арену.
+
+        Аргументы:
+        index - номер доски в арене.
+        board - экземпляр класса доски.
+        '''
+        if len(board._ships) > self._max_ships:
+            raise ValueError(f'На доске должно быть не больше {self._max_ships} кораблей.')
+
+        layout = self._layout
+        size = layout['size']
+        record = bytearray(layout['record'])
+        record[layout['count']] = len(board._ships)
+        record[layout['afloat']] = board._afloat
+        record[layout['shots']] = board._shots
+        record[layout['flags']] = board.display_ships | board.show_boundary << 1 | board.reveal_halo << 2
+
+        for x, cells_row in enumerate(board._cells):
+            for y, cell in enumerate(cells_row):
+                record[layout['cells'] + x * size + y] = (
+                    cell.occupied * BoardView.OCCUPIED
+                    | cell.shot * BoardView.SHOT
+                    | (cell.shot and not cell.missed) * BoardView.HIT
+                    | cell.boundary * BoardView.BOUNDARY
+                    | cell.displayed * BoardView.DISPLAYED)
+
+        for n, ship in enumerate(board._ships):
+            x, y = ship.bow['x'], ship.bow['y']
+            offset = layout['ships'] + n * self._ship_size
+            record[offset:offset + self._ship_size] = bytes((x, y, ship.length, ship.horizontal,
+                                                             ship.hit_mask))
+
+            for i in range(ship.length):
+                cell = x * size + y + i if ship.horizontal else (x + i) * size + y
+                record[layout['owners'] + cell] = n + 1
+
+        with self._record(index) as buf:
+            buf[:] = record
+
+    def view(self, index: int, verbose: bool = True) -> BoardView:
+        '''Вернуть представление доски без копирования.
+
+        Аргументы:
+        index - номер доски в арене.
+        verbose - индикатор того, что результат выстрела нужно выводить в консоль.
+        '''
+        view = BoardView(self._record(index), self._layout, verbose)
+        self._views.add(view)
+        return view
+
+    def load(self, index: int) -> Board:
+        '''Восстановить из записи экземпляр класса доски.
+
+        Аргументы:
+        index - номер доски в арене.
+        '''
+        layout = self._layout
+        size = layout['size']
+
+        with self._record(index) as buf:
+            record = bytes(buf)
+
+        flags = record[layout['flags']]
+        board = Board(display_ships=bool(flags & 1), show_boundary=bool(flags & 2),
+                      reveal_halo=bool(flags & 4))
+
+        for n in range(record[layout['count']]):
+            offset = layout['ships'] + n * self._ship_size
+            x, y, length, horizontal, hits = record[offset:offset + self._ship_size]
+            ship = Ship({'x': x, 'y': y}, length, bool(horizontal))
+            board.add_ship(ship)
+
+            for segment in range(length):
+                if hits >> segment & 1:
+                    ship.damage(segment)
+
+        for x, cells_row in enumerate(board._cells):
+            for y, cell in enumerate(cells_row):
+                state = record[layout['cells'] + x * size + y]
+                cell.shot = bool(state & BoardView.SHOT)
+                cell.missed = not state & BoardView.HIT
+
+                if cell.shot:
+                    board._unknown.discard((x + 1, y + 1))
+
+        board._afloat = record[layout['afloat']]
+        board._shots = record[layout['shots']]
+        return board
+
+    def close(self) -> None:
+        '''Отключиться от арены. Представления досок после этого использовать нельзя.'''
+        for view in list(self._views):
+            view._buf.release()
+        self._views.clear()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        '''Удалить блок общей памяти. Вызывается один раз процессом, создавшим арену.'''
+        self._shm.unlink()
+        self._created.discard(self._shm.name)
+
+
+if __name__ == '__main__':
+    import os
+    import subprocess
+    from .controller import Controller
+
+    controller = Controller(seed=4)
+    board = controller._create_board()
+    board.verbose = False
+    board.process_shot(1, 1)
+    ai_board = controller._create_board(display_ships=False)
+
+    arena = BoardArena(capacity=2)
+    arena.store(0, board)
+    arena.store(1, ai_board)
+
+    loaded = arena.load(0)
+    loaded.verbose = False
+
+    assert [(ship.bow, ship.length, ship.horizontal, ship.hit_mask) for ship in loaded._ships] == \
+           [(ship.bow, ship.length, ship.horizontal, ship.hit_mask) for ship in board._ships]
+    assert loaded.hit_cells() == board.hit_cells()
+    assert arena.view(0).hit_cells() == board.hit_cells()
+
+    # независимо запущенные процессы подключаются к арене по имени: первый доигрывает доску,
+    # второй проверяет результат; выход процесса не должен удалять арену
+    worker = '''
+import sys
+from sea_battle.board_arena import BoardArena
+from sea_battle.ai_player import AIPlayer
+from sea_battle.random_source import RandomSource
+
+arena = BoardArena(name=sys.argv[1])
+view = arena.view(1, verbose=False)
+ai = AIPlayer(view.min + 1, view.max + 1, RandomSource(1))
+
+while not view.all_ships_are_sunken:
+    coords = ai.shoot()
+    if not view.cell_is_shot(*coords):
+        view.process_shot(*coords)
+
+print(len(view.hit_cells()))
+arena.close()
+'''
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    for i in range(2):
+        result = subprocess.run([sys.executable, '-c', worker, arena.name], cwd=root,
+                                capture_output=True, text=True, check=True)
+
+        assert result.stdout.split() == ['11']
+        assert 'leaked' not in result.stderr
+
+    view = arena.view(1, verbose=False)
+
+    assert view.all_ships_are_sunken
+    assert len(view.hit_cells()) == 11
+    assert arena.load(1).all_ships_are_sunken
+
+    # выстрелы через представление и через доску дают одинаковый результат
+    for x in range(1, 7):
+        for y in range(1, 7):
+            if not board.cell_is_shot(x, y):
+                assert arena.view(0, verbose=False).process_shot(x, y) == board.process_shot(x, y)
+
+    assert arena.view(0).all_cells_are_shot and arena.view(0).all_ships_are_sunken
+    arena.view(0).print()
+
+    # ячейки вокруг потопленного корабля отмечаются и через представление
+    board = Controller(seed=4, reveal_halo=True)._create_board()
+    board.verbose = False
+    arena.store(0, board)
+    view = arena.view(0, verbose=False)
+
+    for x in range(1, 7):
+        for y in range(1, 7):
+            if not board.cell_is_shot(x, y):
+                assert view.process_shot(x, y) == board.process_shot(x, y)
+
+                assert all(view.cell_is_shot(i, j) == board.cell_is_shot(i, j)
+                           for i in range(1, 7) for j in range(1, 7))
+
+    assert view.all_cells_are_shot and view.all_ships_are_sunken
+    assert arena.load(0).reveal_halo and not arena.load(0).unknown_cells
+
+    arena.close()
+    arena.unlink()
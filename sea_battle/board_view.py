@@ -0,0 +1,193 @@
+from .errors import ChangeForbiddenError, ShootError, CellCoordsError
+from .cell import Cell
+
+
+class BoardView:
+    '''Класс описывающий доску, состояние которой хранится в записи арены досок.
+
+    Представление не копирует данные: все чтения и изменения выполняются
+    непосредственно в общем буфере, поэтому доска, измененная в одном процессе,
+    сразу видна в другом. Одновременно изменять доску должен только один процесс.
+
+    Аргументы:
+    buf - срез буфера арены, в котором хранится запись доски.
+    layout - смещения полей записи, см. BoardArena.
+    verbose - индикатор того, что результат выстрела нужно выводить в консоль.
+
+    Атрибуты экземпляра:
+    min - минимально допустимая координата ячейки по оси X.
+    max - максимально допустимая координата ячейки по оси Y.
+    all_ships_are_sunken - индикатор потопления всех кораблей.
+    all_cells_are_shot - индикатор того, что по всем ячейкам были произведены выстрелы.
+
+    Методы экземпляра:
+    process_shot(x: int, y: int) - обрабатывает выстрел по ячейке доски.
+    cell_is_shot(x: int, y: int) - проверяет, был ли выстрел по ячейке.
+    hit_cells - возвращает координаты ячеек, по которым было попадание.
+    print - вывести доску в консоль.
+    '''
+    # биты состояния ячейки
+    OCCUPIED = 1
+    SHOT = 2
+    HIT = 4
+    BOUNDARY = 8
+    DISPLAYED = 16
+
+    def __init__(self, buf: memoryview, layout: dict, verbose: bool = True) -> None:
+        self._buf = buf
+        self._layout = layout
+        self._size = layout['size']
+        self.verbose = verbose
+
+    @property
+    def min(self) -> int:
+        '''Минимально допустимая координата ячейки.'''
+        return 0
+
+    @min.setter
+    def min(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def max(self) -> int:
+        '''Максимально допустимая координата ячейки.'''
+        return self._size - 1
+
+    @max.setter
+    def max(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def all_cells_are_shot(self) -> bool:
+        '''Индикатор того, что по всем ячейкам были произведены выстрелы.'''
+        return self._buf[self._layout['shots']] == self._size * self._size
+
+    @all_cells_are_shot.setter
+    def all_cells_are_shot(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def all_ships_are_sunken(self) -> bool:
+        '''Индикатор потопления всех кораблей.'''
+        return not self._buf[self._layout['afloat']]
+
+    @all_ships_are_sunken.setter
+    def all_ships_are_sunken(self, value) -> None:
+        raise ChangeForbiddenError
+
+    def cell_is_shot(self, x: int, y: int) -> bool:
+        '''Проверяет, был ли выстрел по ячейке.
+
+        Аргументы:
+        x - координата ячейки по оси X в системе координат пользователя.
+        y - координата ячейки по оси Y в системе координат пользователя.
+        '''
+        return bool(self._buf[self._layout['cells'] + (x - 1) * self._size + y - 1] & self.SHOT)
+
+    def process_shot(self, x: int, y: int) -> bool:
+        '''Обрабатывает выстрел по ячейке доски.
+        В качестве значения выозвращает булево значение указывающее на успешность выстрела.
+
+        Аргументы:
+        x - координата ячейки по оси X.
+        y - координата ячейки по оси Y.
+        '''
+        _min = self.min + 1
+        _max = self.max + 1
+
+        if x < _min or x > _max:
+            raise CellCoordsError(f'''Координата "x" должна быть от {_min} до {_max}''')
+
+        elif y < _min or y > _max:
+            raise CellCoordsError(f'''Координата "y" должна быть от {_min} до {_max}''')
+
+        buf, layout = self._buf, self._layout
+        # система координат пользователя начинается с 1
+        i = (x - 1) * self._size + y - 1
+        flags = buf[layout['cells'] + i]
+
+        if flags & self.SHOT:
+            raise ShootError
+
+        buf[layout['shots']] += 1
+        ship = buf[layout['owners'] + i]
+
+        if not ship:
+            buf[layout['cells'] + i] = flags | self.SHOT
+
+            if self.verbose:
+                print('МИМО!!!')
+            return False
+
+        buf[layout['cells'] + i] = flags | self.SHOT | self.HIT
+        offset = layout['ships'] + (ship - 1) * layout['ship_size']
+        bow_x, bow_y, length, horizontal = buf[offset:offset + 4]
+        # номер поврежденной части корабля от носа
+        segment = y - 1 - bow_y if horizontal else x - 1 - bow_x
+        buf[offset + 4] |= 1 << segment
+        sunken = buf[offset + 4] == (1 << length) - 1
+
+        if sunken:
+            buf[layout['afloat']] -= 1
+
+            # признак reveal_halo доски: ячейки вокруг потопленного корабля отмечаются промахами
+            if buf[layout['flags']] & 4:
+                self._reveal_halo(ship)
+
+        if self.verbose:
+            if sunken:
+                print('ПОТОПИЛ!!!')
+            else:
+                print('ПОПАЛ!!!')
+
+        return True
+
+    def _reveal_halo(self, ship: int) -> None:
+        '''Отмечает ячейки вокруг потопленного корабля как промахи.
+
+        Аргументы:
+        ship - номер корабля в записи, начиная с 1.
+        '''
+        buf, layout, size = self._buf, self._layout, self._size
+        offset = layout['ships'] + (ship - 1) * layout['ship_size']
+        x, y, length, horizontal = buf[offset:offset + 4]
+        last_x = x + (0 if horizontal else length - 1)
+        last_y = y + (length - 1 if horizontal else 0)
+
+        for row in range(x - 1 if x else 0, last_x + 2 if last_x + 2 < size else size):
+            for col in range(y - 1 if y else 0, last_y + 2 if last_y + 2 < size else size):
+                i = layout['cells'] + row * size + col
+
+                if not buf[i] & self.SHOT:
+                    buf[i] |= self.SHOT
+                    buf[layout['shots']] += 1
+
+    def hit_cells(self) -> list[tuple[int, int]]:
+        '''Возвращает координаты ячеек, по которым было попадание,
+        в системе координат пользователя.'''
+        cells = self._layout['cells']
+        return [(i // self._size + 1, i % self._size + 1)
+                for i in range(self._size * self._size)
+                if self._buf[cells + i] & self.HIT]
+
+    def print(self) -> None:
+        '''Вывести доску в консоль.'''
+        print('  | ' + ' | '.join(str(i) for i in range(1, self._size + 1)) + ' ')
+        for x in range(self._size):
+            print(f'{x + 1} | {" | ".join(str(self._cell(x, y)) for y in range(self._size))}')
+
+    def _cell(self, x: int, y: int) -> Cell:
+        '''Возвращает ячейку, построенную по состоянию в записи.
+
+        Аргументы:
+        x - индекс строки ячейки.
+        y - индекс столбца ячейки.
+        '''
+        flags = self._buf[self._layout['cells'] + x * self._size + y]
+        cell = Cell(y, x)
+        cell.occupied = bool(flags & self.OCCUPIED)
+        cell.shot = bool(flags & self.SHOT)
+        cell.missed = not flags & self.HIT
+        cell.boundary = bool(flags & self.BOUNDARY)
+        cell.displayed = bool(flags & self.DISPLAYED)
+        return cell
@@ -0,0 +1,235 @@
+import sys
+# аннотации ссылаются на классы через пакет: он загружает их модули только при обращении
+import sea_battle
+from .errors import BoardCreationError, InvalidCoordsError, ShootError, CellCoordsError
+from .board import Board
+from .ship import Ship
+from .ai_player import AIPlayer
+from .random_source import RandomSource
+from .move_timer import MoveTimer
+
+
+class Controller:
+    '''Класс описывающий контроллера игрового процесса.
+
+    Аргументы:
+    seed - зерно генератора случайных чисел игры.
+    rng - генератор случайных чисел игры. Если указан, seed игнорируется.
+    spectators - концентратор рассылки изменений досок зрителям.
+    opponent_model - модель расстановки кораблей пользователя. ИИ использует ее
+    при выборе выстрелов, а после завершения игры она пополняется и сохраняется.
+    move_deadline - время на обдумывание хода ИИ в секундах.
+    reveal_halo - индикатор того, что ячейки вокруг потопленного корабля
+    сразу отмечаются как промахи.
+
+    Методы экземпляра:
+    start_game - начинает игру.
+    print_boards - печатает доски в консоль.
+    move_stats - возвращает статистику длительности ходов ИИ.
+    '''
+    # длины кораблей флота: 1 корабль на 3 клетки, 2 корабля на 2 клетки, 4 корабля на одну клетку
+    _fleet = (3, 2, 2, 1, 1, 1, 1)
+
+    def __init__(self, seed=None, rng: RandomSource = None,
+                 spectators: 'sea_battle.SpectatorHub' = None,
+                 opponent_model: 'sea_battle.PlacementModel' = None,
+                 move_deadline: float = None, reveal_halo: bool = False) -> None:
+        # генератор случайных чисел игры, по зерну партия воспроизводится полностью
+        self._rng = rng if rng is not None else RandomSource(seed)
+        self._spectators = spectators
+        self._opponent_model = opponent_model
+        # ходы ИИ выбираются с учетом времени на обдумывание, их длительность учитывается
+        self._move_timer = MoveTimer(move_deadline)
+        self._reveal_halo = reveal_halo
+        # количество попыток для создания игровых досок
+        self._attempt = 10
+        # доска пользователя
+        self._human_board = None
+        # доска ИИ
+        self._ai_board = None
+        # True - ход игрока, False - ИИ
+        self._human_step = True
+
+    def start_game(self):
+        '''Начинает игру.'''
+        self._setup()
+        self._show_greeting()
+        self.print_boards()
+
+        while True:
+            if self._human_step:
+                try:
+                    print('=' * 25 + ' ВЫ ' + '=' * 25)
+                    coords = self._get_cell_coords()
+
+                    if len(coords) != 2:
+                        raise InvalidCoordsError
+
+                    print(f'Вы стреляете по ячейке с координатами ({coords[0]}, {coords[1]})')
+
+                    try:
+                        successful = self._ai_board.process_shot(coords[0], coords[1])
+
+                        if not successful:
+                            self._human_step = False
+
+                        if self._ai_board.all_ships_are_sunken:
+                            print('Вы выиграли!')
+                            self.print_boards()
+                            break
+                    except (ShootError, CellCoordsError) as e:
+                        print(e)
+                except InvalidCoordsError as e:
+                    print(e)
+                except Exception:
+                    print('В время игры возникла непредвиденная ошибка.')
+                    print('Выход.')
+                    break
+            else:
+                print('=' * 25 + ' ИИ ' + '=' * 25)
+                coords = self._move_timer.choose(self._ai_player)
+                print(f'ИИ стреляет по ячейке с координатами ({coords[0]}, {coords[1]})')
+                successful = self._human_board.process_shot(coords[0], coords[1])
+
+                if not successful:
+                    self._human_step = True
+
+                if self._human_board.all_ships_are_sunken:
+                    print('ИИ выиграл. В следующий раз повезет больше.')
+                    self.print_boards()
+                    break
+
+            if self._ai_board.all_cells_are_shot or self._human_board.all_cells_are_shot:
+                print('Ничья')
+                self.print_boards()
+                break
+
+            self.print_boards()
+
+        self._update_opponent_model()
+
+    def _setup(self):
+        '''Формирует и заполняет доски для пользователя и ИИ.'''
+        try:
+            self._create_human_board()
+            self._create_ai_board()
+            self._ai_player = AIPlayer(self._ai_board.min + 1, self._ai_board.max + 1,
+                                       self._rng.spawn(), self._opponent_model,
+                                       self._human_board.unknown_cells)
+
+            if self._spectators is not None:
+                self._spectators.attach('human', self._human_board)
+                self._spectators.attach('ai', self._ai_board)
+        except BoardCreationError as e:
+            if self._attempt:
+                self._attempt -= 1
+                self._setup()
+            else:
+                print(e)
+                sys.exit()
+
+    def move_stats(self) -> dict[str, dict]:
+        '''Возвращает статистику ходов ИИ по стратегиям: количество ходов,
+        превышения времени на ход и перцентили p50, p95, p99 их длительности.'''
+        return self._move_timer.stats()
+
+    def _update_opponent_model(self) -> None:
+        '''Учитывает расстановку кораблей пользователя в модели соперника, если игра завершена.'''
+        if self._opponent_model is None:
+            return
+
+        for board in (self._human_board, self._ai_board):
+            if board.all_ships_are_sunken or board.all_cells_are_shot:
+                self._opponent_model.update(self._human_board)
+                self._opponent_model.save()
+                return
+
+    def _get_cell_coords(self) -> list[int, int]:
+        '''Получить координаты выстрела.'''
+        _input = self._read_move()
+        coords = list(map(int, _input.split()))
+
+        return coords
+
+    def _read_move(self) -> str:
+        '''Прочитать строку с координатами выстрела пользователя.'''
+        return input('Введите координаты выстрела: ')
+
+    def _create_human_board(self) -> None:
+        '''Создает доску для пользователя.'''
+        self._human_board = self._create_board()
+
+    def _create_ai_board(self) -> None:
+        '''Создает доску для ИИ.'''
+        self._ai_board = self._create_board(display_ships=False)
+
+    def _create_board(self, display_ships: bool = True) -> Board:
+        '''Создает доску и случайным образом расставляет на ней корабли.
+
+        Аргументы:
+        display_ships - индикатор того, что нужно отображать корабли на доске.
+        '''
+        board = Board(display_ships=display_ships, reveal_halo=self._reveal_halo)
+
+        for length in self._fleet:
+            # все допустимые варианты размещения проверяются одним вызовом,
+            # поэтому выбор среди них равновероятен, как и при случайных попытках
+            candidates = board.placement_candidates(length)
+            legal = [candidate for candidate, ok in zip(candidates, board.check_placements(candidates)) if ok]
+
+            if not legal:
+                raise BoardCreationError
+
+            bow, length, horizontal = self._rng.choice(legal)
+            board.add_ship(Ship(bow=bow, length=length, horizontal=horizontal))
+
+        return board
+
+    def _show_greeting(self) -> None:
+        '''Отображает приветствие и правила игры.'''
+        print('-' * 100)
+        print()
+        print('Добро пожаловать в игру "Морской бой"!')
+        print()
+        print('Правила игры:')
+        print()
+        print('1. Корабль на вашей доске отображается в виде точки.')
+        print('2. Для совершения выстрела введите в консоль координаты ячейки ввиде двух чисел, например: 1 2.')
+        print('3. Промах отметачется буквой "T", попадание - "X".')
+        print('4. Если выстрел игрока был успешным, он получает еще ход.')
+        print('5. Победит тот, кто первым потопит корабли противника.')
+
+        if self._reveal_halo:
+            print('6. Ячейки вокруг потопленного корабля сразу отмечаются как промахи.')
+        print()
+        print('Удачи!')
+
+    def print_boards(self) -> None:
+        '''Печатает доски в консоль.'''
+        print()
+        print('Ваша доска:')
+        self._human_board.print()
+        print()
+        print('Доска ИИ:')
+        self._ai_board.print()
+        print()
+
+
+if __name__ == '__main__':
+    controller = Controller()
+    controller._setup()
+    controller.print_boards()
+
+    # партии с одинаковым зерном полностью совпадают
+    controller_1 = Controller(seed=2024)
+    controller_1._setup()
+    controller_2 = Controller(seed=2024)
+    controller_2._setup()
+
+    for board_1, board_2 in ((controller_1._human_board, controller_2._human_board),
+                             (controller_1._ai_board, controller_2._ai_board)):
+        assert [(ship.bow, ship.length, ship.horizontal) for ship in board_1._ships] == \
+               [(ship.bow, ship.length, ship.horizontal) for ship in board_2._ships]
+
+    assert [controller_1._ai_player.shoot() for i in range(36)] == \
+           [controller_2._ai_player.shoot() for i in range(36)]
@@ -0,0 +1,60 @@
+'''Исключения игры "Морской бой".'''
+
+
+class BoardCreationError(Exception):
+    '''Неудачная попытка создания доски.'''
+    def __str__(self) -> str:
+        return 'Не удалось создать доску для игры.'
+
+
+class CellCoordsError(Exception):
+    '''Ошибка в указании координаты ячейки.'''
+    pass
+
+
+class CellsAllocationError(Exception):
+    '''Не удалось выделить достаточное количество ячеек для размещения корабля.'''
+    def __str__(self) -> str:
+        return 'Не удалось выделить достаточное количество ячеек для размещения корабля.'
+
+
+class ChangeForbiddenError(Exception):
+    '''Запрещено изменять.'''
+    def __str__(self) -> str:
+        return 'Запрещено изменять.'
+
+
+class InvalidCoordsError(Exception):
+    '''Неверно введены координаты ячейки.'''
+    def __str__(self) -> str:
+        return 'Неверно введены координаты ячейки.'
+
+
+class ScriptExhaustedError(Exception):
+    '''Закончились ходы в сценарии игры.'''
+    def __str__(self) -> str:
+        return 'Закончились ходы в сценарии игры.'
+
+
+class ShipDislocationAreaError(Exception):
+    '''Недопустимая область для размещения корабля.'''
+    def __str__(self) -> str:
+        return 'Недопустимая область для размещения корабля.'
+
+
+class ShipExistsError(Exception):
+    '''Корабль уже добавлен.'''
+    def __str__(self) -> str:
+        return 'Корабль уже добавлен.'
+
+
+class ShootError(Exception):
+    '''Не разрешено стрелять по одной и той же ячейкe несколько раз подряд.'''
+    def __str__(self) -> str:
+        return 'Не разрешено стрелять по одной и той же ячейкe несколько раз подряд.'
+
+
+class UndoError(Exception):
+    '''Нет выстрелов для отмены.'''
+    def __str__(self) -> str:
+        return 'Нет выстрелов для отмены.'
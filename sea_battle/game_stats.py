@@ -0,0 +1,178 @@
+from collections import Counter
+
+
+class GameStats:
+    '''Класс описывающий потоковую агрегацию результатов игр.
+
+    Результаты добавляются по одному по мере их появления и не сохраняются.
+    Все сводки - счетчики и гистограммы с ограниченной областью значений,
+    поэтому память не зависит от количества игр, а сводки нескольких
+    процессов объединяются сложением счетчиков.
+
+    Атрибуты экземпляра:
+    games - количество учтенных игр.
+    draws - количество игр, закончившихся ничьей.
+    shots_histogram - гистограмма количества выстрелов победителя.
+    cell_hits - частота попаданий по ячейкам.
+    win_rates - доля побед по стратегиям.
+    first_move_advantage - доля побед игрока, ходившего первым, среди игр с победителем.
+
+    Методы экземпляра:
+    add_game - учесть результат одной игры.
+    consume(results) - учесть результаты игр из итерируемого объекта.
+    merge(other: GameStats) - добавить сводки другого экземпляра.
+    shots_quantile(q: float) - квантиль количества выстрелов победителя.
+    '''
+    def __init__(self) -> None:
+        self.games = 0
+        self.draws = 0
+        # количество выстрелов победителя -> количество игр
+        self._shots = Counter()
+        # координаты ячейки -> количество попаданий
+        self._cell_hits = Counter()
+        self._strategy_games = Counter()
+        self._strategy_wins = Counter()
+        self._first_mover_wins = 0
+
+    def add_game(self, strategies: list[str], winner: int = None, first: int = 0,
+                 shots: int = 0, hits: list[tuple[int, int]] = ()) -> None:
+        '''Учесть результат одной игры.
+
+        Аргументы:
+        strategies - список стратегий игроков, индекс в списке - номер игрока.
+        winner - номер победителя или None в случае ничьей.
+        first - номер игрока, который ходил первым.
+        shots - количество выстрелов победителя.
+        hits - координаты ячеек, по которым было попадание, например Board.hit_cells().
+        '''
+        self.games += 1
+        self._strategy_games.update(strategies)
+        self._cell_hits.update(hits)
+
+        if winner is None:
+            self.draws += 1
+            return
+
+        self._shots[shots] += 1
+        self._strategy_wins[strategies[winner]] += 1
+
+        if winner == first:
+            self._first_mover_wins += 1
+
+    def consume(self, results) -> 'GameStats':
+        '''Учесть результаты игр из итерируемого объекта по мере их поступления.
+
+        Аргументы:
+        results - итерируемый объект словарей с аргументами метода add_game.
+        '''
+        for result in results:
+            self.add_game(**result)
+        return self
+
+    def merge(self, other: 'GameStats') -> 'GameStats':
+        '''Добавить сводки другого экземпляра к текущему.
+
+        Аргументы:
+        other - экземпляр класса GameStats, например, полученный от другого процесса.
+        '''
+        self.games += other.games
+        self.draws += other.draws
+        self._shots.update(other._shots)
+        self._cell_hits.update(other._cell_hits)
+        self._strategy_games.update(other._strategy_games)
+        self._strategy_wins.update(other._strategy_wins)
+        self._first_mover_wins += other._first_mover_wins
+        return self
+
+    @property
+    def shots_histogram(self) -> dict[int, int]:
+        '''Гистограмма количества выстрелов победителя.'''
+        return dict(sorted(self._shots.items()))
+
+    @property
+    def cell_hits(self) -> dict[tuple[int, int], int]:
+        '''Частота попаданий по ячейкам.'''
+        return dict(self._cell_hits)
+
+    @property
+    def win_rates(self) -> dict[str, float]:
+        '''Доля побед по стратегиям.'''
+        return {strategy: self._strategy_wins[strategy] / games
+                for strategy, games in self._strategy_games.items()}
+
+    @property
+    def first_move_advantage(self) -> float:
+        '''Доля побед игрока, ходившего первым, среди игр с победителем.'''
+        decided = self.games - self.draws
+        return self._first_mover_wins / decided if decided else 0.0
+
+    def shots_quantile(self, q: float) -> int:
+        '''Квантиль количества выстрелов победителя.
+        Гистограмма хранит точные значения, поэтому квантиль тоже точный.
+
+        Аргументы:
+        q - уровень квантиля от 0 до 1.
+        '''
+        total = sum(self._shots.values())
+
+        if not total:
+            return 0
+
+        rank = q * (total - 1)
+        seen = 0
+        for shots, n in sorted(self._shots.items()):
+            seen += n
+            if seen > rank:
+                return shots
+        return shots
+
+
+if __name__ == '__main__':
+    import pickle
+    from .errors import BoardCreationError
+    from .controller import Controller
+    from .ai_player import AIPlayer
+
+    def play(seed: int) -> dict:
+        '''Провести игру двух случайных стрелков и вернуть ее результат.'''
+        controller = Controller(seed=seed)
+
+        while True:
+            try:
+                controller._create_human_board()
+                controller._create_ai_board()
+                break
+            except BoardCreationError:
+                pass
+
+        # игрок 0 стреляет по доске ИИ, игрок 1 - по доске пользователя
+        boards = [controller._ai_board, controller._human_board]
+        players = [AIPlayer(board.min + 1, board.max + 1, controller._rng.spawn()) for board in boards]
+        shots = [0, 0]
+
+        for board in boards:
+            board.verbose = False
+
+        player = 0
+        while True:
+            shots[player] += 1
+
+            if not boards[player].process_shot(*players[player].shoot()):
+                player = 1 - player
+            elif boards[player].all_ships_are_sunken:
+                return {'strategies': ['random', 'random'], 'winner': player, 'first': 0,
+                        'shots': shots[player], 'hits': boards[player].hit_cells()}
+
+    stats_1 = GameStats().consume(play(seed) for seed in range(50))
+    stats_2 = GameStats().consume(play(seed) for seed in range(50, 100))
+    stats = pickle.loads(pickle.dumps(stats_1)).merge(stats_2)
+
+    assert stats.games == 100
+    assert sum(stats.shots_histogram.values()) == 100 - stats.draws
+    assert sum(stats.cell_hits.values()) >= 100 * 11
+    assert stats.shots_quantile(0) <= stats.shots_quantile(0.5) <= stats.shots_quantile(1)
+    assert 0 <= stats.first_move_advantage <= 1
+    assert set(stats.win_rates) == {'random'}
+
+    print(stats.shots_histogram)
+    print(stats.first_move_advantage)
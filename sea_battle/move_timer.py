@@ -0,0 +1,149 @@
+from collections import Counter, deque
+from math import ceil
+from time import perf_counter
+
+
+def percentile(values: list[float], q: float) -> float:
+    '''Вернуть перцентиль отсортированного списка значений методом ближайшего ранга:
+    наименьшее значение x, для которого доля значений, не превышающих x, не меньше q.
+
+    Аргументы:
+    values - отсортированный список значений.
+    q - уровень перцентиля от 0 до 1.
+    '''
+    if not values:
+        return 0.0
+    return values[max(0, ceil(q * len(values)) - 1)]
+
+
+class MoveTimer:
+    '''Класс описывающий выбор хода ИИ с ограничением времени на обдумывание.
+
+    Стратегия должна иметь методы propose(deadline) и commit(coords).
+    propose - генератор вариантов хода: первый вариант выдается сразу
+    и служит запасным, каждый следующий не хуже предыдущего. Варианты
+    запрашиваются, пока не истечет время на ход, после чего выбирается
+    последний полученный вовремя вариант и передается в commit.
+    Ход не прерывается принудительно, поэтому стратегия сама не начинает
+    шаг улучшения, который не успеет завершить до deadline, а ход,
+    длительность которого превысила ограничение, учитывается как промах.
+
+    Аргументы:
+    deadline - время на ход в секундах. Если не указано, стратегия думает до конца.
+    samples - количество последних ходов каждой стратегии, по которым считаются перцентили.
+
+    Методы экземпляра:
+    choose(strategy, name: str) - выбрать ход стратегии.
+    stats - вернуть статистику ходов по стратегиям.
+    '''
+    def __init__(self, deadline: float = None, samples: int = 10000) -> None:
+        self.deadline = deadline
+        self._samples = samples
+        # имя стратегии -> длительности последних ходов
+        self._latencies = {}
+        self._moves = Counter()
+        self._misses = Counter()
+
+    def choose(self, strategy, name: str = None) -> tuple[int, int]:
+        '''Выбрать ход стратегии с учетом времени на ход.
+
+        Аргументы:
+        strategy - стратегия с методами propose и commit.
+        name - имя стратегии в статистике. По умолчанию - имя ее класса.
+        '''
+        name = name or type(strategy).__name__
+        start = perf_counter()
+        stop = start + self.deadline if self.deadline is not None else None
+        proposals = strategy.propose(stop)
+        # запасной ход используется, даже если он получен после истечения времени
+        move = next(proposals)
+
+        while stop is None or perf_counter() < stop:
+            try:
+                candidate = next(proposals)
+            except StopIteration:
+                break
+
+            if stop is not None and perf_counter() > stop:
+                break
+            move = candidate
+
+        proposals.close()
+        strategy.commit(move)
+        elapsed = perf_counter() - start
+
+        if name not in self._latencies:
+            self._latencies[name] = deque(maxlen=self._samples)
+        self._latencies[name].append(elapsed)
+        self._moves[name] += 1
+
+        if stop is not None and elapsed > self.deadline:
+            self._misses[name] += 1
+
+        return move
+
+    def stats(self) -> dict[str, dict]:
+        '''Вернуть статистику ходов по стратегиям: количество ходов, количество
+        превышений времени на ход и перцентили длительности хода в секундах.'''
+        result = {}
+
+        for name, latencies in self._latencies.items():
+            values = sorted(latencies)
+            result[name] = {
+                'moves': self._moves[name],
+                'deadline_misses': self._misses[name],
+                'p50': percentile(values, 0.5),
+                'p95': percentile(values, 0.95),
+                'p99': percentile(values, 0.99),
+            }
+        return result
+
+
+if __name__ == '__main__':
+    from time import sleep
+
+    class SlowStrategy:
+        '''Стратегия, которая улучшает ход каждые 10 мс.'''
+        def __init__(self) -> None:
+            self.committed = None
+
+        def propose(self, deadline: float = None):
+            for move in range(100):
+                yield (move, move)
+
+                # следующий шаг не начинается, если не успеет завершиться
+                if deadline is not None and perf_counter() + 0.01 > deadline:
+                    return
+                sleep(0.01)
+
+        def commit(self, coords: tuple[int, int]) -> None:
+            self.committed = coords
+
+    timer = MoveTimer(deadline=0.035)
+    strategy = SlowStrategy()
+    move = timer.choose(strategy)
+
+    assert move == strategy.committed
+    assert 2 <= move[0] <= 3
+
+    class LateStrategy(SlowStrategy):
+        '''Стратегия, которой не хватает времени даже на запасной ход.'''
+        def propose(self, deadline: float = None):
+            sleep(0.05)
+            yield (1, 1)
+
+    assert timer.choose(LateStrategy()) == (1, 1)
+
+    stats = timer.stats()
+
+    assert stats['SlowStrategy']['deadline_misses'] == 0
+    assert stats['SlowStrategy']['p50'] <= 0.035
+    assert stats['LateStrategy']['deadline_misses'] == 1
+    assert stats['LateStrategy']['p99'] >= 0.05
+
+    assert percentile([], 0.5) == 0.0
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.5) == 3.0
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.99) == 5.0
+    assert percentile([1.0, 2.0], 0.5) == 1.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 0.0) == 1.0
@@ -0,0 +1,153 @@
+from collections import Counter
+import json
+import os
+from .board import Board
+
+
+class PlacementModel:
+    '''Класс описывающий модель расстановки кораблей соперника.
+
+    Модель накапливает по завершенным играм, как часто корабли соперника
+    занимали каждую ячейку и как часто корабли каждой длины располагались
+    горизонтально. Игрок ИИ использует ее как априорное распределение
+    при выборе порядка выстрелов.
+
+    Аргументы:
+    path - путь к файлу модели. Если не указан, модель не сохраняется на диск.
+
+    Атрибуты экземпляра:
+    path - путь к файлу модели.
+    games - количество учтенных игр.
+
+    Методы класса:
+    open(opponent: str, directory: str) - вернуть модель соперника из кэша или с диска.
+
+    Методы экземпляра:
+    update(board: Board) - учесть расстановку кораблей на доске завершенной игры.
+    save - сохранить модель на диск.
+    weight(x: int, y: int) - вероятность того, что ячейка занята кораблем.
+    horizontal_probability(length: int) - вероятность горизонтального расположения корабля.
+    '''
+    # загруженные модели по путям к их файлам
+    _cache = {}
+
+    def __init__(self, path: str = None) -> None:
+        self.path = path
+        self.games = 0
+        # координаты ячейки в системе координат пользователя -> количество игр, в которых она была занята
+        self._cells = Counter()
+        # длина корабля -> [количество горизонтальных, количество вертикальных]
+        self._orientations = {}
+
+    @classmethod
+    def open(cls, opponent: str, directory: str) -> 'PlacementModel':
+        '''Вернуть модель соперника из кэша или с диска.
+        Если файла модели еще нет, возвращается пустая модель.
+
+        Аргументы:
+        opponent - идентификатор соперника, используется как имя файла.
+        directory - каталог с файлами моделей.
+        '''
+        path = os.path.join(directory, f'{opponent}.json')
+
+        if path not in cls._cache:
+            model = cls(path)
+
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+
+                model.games = data['games']
+                model._cells = Counter({tuple(map(int, key.split())): n
+                                        for key, n in data['cells'].items()})
+                model._orientations = {int(length): counts
+                                       for length, counts in data['orientations'].items()}
+
+            cls._cache[path] = model
+        return cls._cache[path]
+
+    def update(self, board: Board) -> None:
+        '''Учесть расстановку кораблей на доске завершенной игры.
+        Стоимость обновления пропорциональна суммарной длине кораблей.
+
+        Аргументы:
+        board - экземпляр класса доски.
+        '''
+        self.games += 1
+
+        for ship in board._ships:
+            x, y = ship.bow['x'] + 1, ship.bow['y'] + 1
+
+            for i in range(ship.length):
+                self._cells[(x, y + i) if ship.horizontal else (x + i, y)] += 1
+
+            if ship.length > 1:
+                counts = self._orientations.setdefault(ship.length, [0, 0])
+                counts[0 if ship.horizontal else 1] += 1
+
+    def save(self) -> None:
+        '''Сохранить модель на диск. Файл заменяется целиком, чтобы не оставить его поврежденным.'''
+        if self.path is None:
+            return
+
+        data = {
+            'games': self.games,
+            'cells': {f'{x} {y}': n for (x, y), n in self._cells.items()},
+            'orientations': self._orientations,
+        }
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def weight(self, x: int, y: int) -> float:
+        '''Вероятность того, что ячейка занята кораблем, со сглаживанием Лапласа.
+
+        Аргументы:
+        x - координата ячейки по оси X в системе координат пользователя.
+        y - координата ячейки по оси Y в системе координат пользователя.
+        '''
+        return (self._cells[(x, y)] + 1) / (self.games + 2)
+
+    def horizontal_probability(self, length: int) -> float:
+        '''Вероятность горизонтального расположения корабля со сглаживанием Лапласа.
+
+        Аргументы:
+        length - длина корабля.
+        '''
+        horizontal, vertical = self._orientations.get(length, (0, 0))
+        return (horizontal + 1) / (horizontal + vertical + 2)
+
+
+if __name__ == '__main__':
+    import tempfile
+    from .ship import Ship
+
+    board = Board(verbose=False)
+    board.add_ship(Ship({'x': 0, 'y': 0}, 3))
+    board.add_ship(Ship({'x': 2, 'y': 5}, 2, horizontal=False))
+
+    with tempfile.TemporaryDirectory() as directory:
+        model = PlacementModel.open('player', directory)
+
+        assert model.games == 0
+        assert model.weight(1, 1) == 0.5
+
+        for i in range(3):
+            model.update(board)
+        model.save()
+
+        assert PlacementModel.open('player', directory) is model
+
+        PlacementModel._cache.clear()
+        loaded = PlacementModel.open('player', directory)
+
+        assert loaded is not model
+        assert loaded.games == 3
+        assert loaded.weight(1, 3) == 0.8
+        assert loaded.weight(4, 6) == 0.8
+        assert loaded.weight(6, 1) == 0.2
+        assert loaded.horizontal_probability(3) == 0.8
+        assert loaded.horizontal_probability(2) == 0.2
@@ -0,0 +1,36 @@
+from random import Random
+
+
+class RandomSource(Random):
+    '''Класс описывающий генератор случайных чисел отдельной игры или игрока.
+
+    Каждая игра и каждый игрок получают собственный экземпляр генератора,
+    поэтому партия полностью воспроизводится по зерну и не зависит
+    от глобального состояния модуля random.
+
+    Аргументы:
+    seed - зерно генератора. Если не указано, используется системный источник энтропии.
+
+    Методы экземпляра:
+    spawn - создать независимый дочерний генератор.
+    '''
+    def __init__(self, seed=None) -> None:
+        super().__init__(seed)
+
+    def spawn(self) -> 'RandomSource':
+        '''Создать независимый дочерний генератор, зерно которого
+        определяется состоянием текущего генератора.'''
+        return RandomSource(self.getrandbits(64))
+
+
+if __name__ == '__main__':
+    rng_1 = RandomSource(42)
+    rng_2 = RandomSource(42)
+
+    assert [rng_1.randint(0, 5) for i in range(1000)] == [rng_2.randint(0, 5) for i in range(1000)]
+
+    child_1 = rng_1.spawn()
+    child_2 = rng_2.spawn()
+
+    assert child_1.random() == child_2.random()
+    assert rng_1.random() == rng_2.random()
@@ -0,0 +1,187 @@
+from contextlib import redirect_stdout
+from time import perf_counter
+import os
+import sys
+# аннотации ссылаются на классы через пакет: он загружает их модули только при обращении
+import sea_battle
+from .errors import ScriptExhaustedError
+from .controller import Controller
+from .move_timer import percentile
+from .random_source import RandomSource
+
+
+class ScriptedController(Controller):
+    '''Класс описывающий контроллера, который берет ходы пользователя из сценария.
+
+    Игровой цикл Controller.start_game выполняется без изменений, включая
+    проверку координат и обработку ошибок, поэтому сценарий нагружает
+    тот же код, что и живая игра.
+
+    Аргументы:
+    moves - источник ходов: путь к файлу ("-" - стандартный ввод), открытый файл
+    или итерируемый объект строк вида "1 2" либо пар координат.
+    seed - зерно генератора случайных чисел игры.
+    rng - генератор случайных чисел игры. Если указан, seed игнорируется.
+    quiet - индикатор того, что вывод игры в консоль нужно подавить.
+    spectators - концентратор рассылки изменений досок зрителям.
+    opponent_model - модель расстановки кораблей пользователя.
+    move_deadline - время на обдумывание хода ИИ в секундах.
+    reveal_halo - индикатор того, что ячейки вокруг потопленного корабля
+    сразу отмечаются как промахи.
+
+    Методы экземпляра:
+    run - провести игру по сценарию и вернуть отчет о производительности.
+    '''
+    def __init__(self, moves, seed=None, rng: RandomSource = None, quiet: bool = True,
+                 spectators: 'sea_battle.SpectatorHub' = None,
+                 opponent_model: 'sea_battle.PlacementModel' = None,
+                 move_deadline: float = None, reveal_halo: bool = False) -> None:
+        super().__init__(seed, rng, spectators, opponent_model, move_deadline, reveal_halo)
+        self._quiet = quiet
+        self._file = None
+
+        if isinstance(moves, str):
+            self._file = sys.stdin if moves == '-' else open(moves, encoding='utf-8')
+            moves = self._file
+
+        self._moves = iter(moves)
+        # моменты завершения ходов, каждая итерация игрового цикла заканчивается выводом досок
+        self._marks = []
+        self._exhausted = False
+
+    def run(self) -> dict:
+        '''Провести игру по сценарию и вернуть отчет о производительности.'''
+        try:
+            if self._quiet:
+                with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                    elapsed = self._timed_game()
+            else:
+                elapsed = self._timed_game()
+        finally:
+            if self._file is not None and self._file is not sys.stdin:
+                self._file.close()
+
+        return self._report(elapsed)
+
+    def _timed_game(self) -> float:
+        '''Провести игру и вернуть время ее выполнения в секундах.'''
+        start = perf_counter()
+        self.start_game()
+        return perf_counter() - start
+
+    def _report(self, elapsed: float) -> dict:
+        '''Сформировать отчет о производительности.
+
+        Аргументы:
+        elapsed - время выполнения игры в секундах.
+        '''
+        latencies = sorted(b - a for a, b in zip(self._marks, self._marks[1:]))
+        turns = len(latencies)
+
+        return {
+            'turns': turns,
+            'elapsed': elapsed,
+            'turns_per_second': turns / elapsed if elapsed else 0.0,
+            'latency_mean': sum(latencies) / turns if turns else 0.0,
+            'latency_p50': percentile(latencies, 0.5),
+            'latency_p95': percentile(latencies, 0.95),
+            'latency_max': latencies[-1] if turns else 0.0,
+            'exhausted': self._exhausted,
+            'outcome': self._outcome(),
+            'ai_moves': self.move_stats(),
+        }
+
+    def _outcome(self) -> str:
+        '''Возвращает исход игры: 'win' - победил пользователь, 'loss' - победил ИИ,
+        'draw' - ничья, 'aborted' - игра прервана ошибкой или окончанием сценария.
+        Прерванная игра короче настоящей, поэтому ее замеры нельзя сравнивать с другими.'''
+        if self._ai_board.all_ships_are_sunken:
+            return 'win'
+        elif self._human_board.all_ships_are_sunken:
+            return 'loss'
+        elif self._ai_board.all_cells_are_shot or self._human_board.all_cells_are_shot:
+            return 'draw'
+        return 'aborted'
+
+    def _read_move(self) -> str:
+        '''Прочитать следующую строку с координатами выстрела из сценария.'''
+        try:
+            move = next(self._moves)
+        except StopIteration:
+            self._exhausted = True
+            raise ScriptExhaustedError
+
+        if isinstance(move, str):
+            return move
+        return ' '.join(map(str, move))
+
+    def print_boards(self) -> None:
+        '''Печатает доски в консоль и отмечает завершение хода.'''
+        super().print_boards()
+        self._marks.append(perf_counter())
+
+
+if __name__ == '__main__':
+    from .placement_model import PlacementModel
+    from .spectator_hub import SpectatorHub
+
+    # запуск: python -m sea_battle.scripted_controller <файл с ходами или "-"> [зерно]
+    if len(sys.argv) > 1:
+        seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        report = ScriptedController(sys.argv[1], seed=seed).run()
+
+        for key, value in report.items():
+            print(f'{key}: {value}')
+        sys.exit()
+
+    # все ячейки доски и несколько ошибочных ходов
+    moves = [f'{x} {y}' for x in range(1, 7) for y in range(1, 7)]
+    moves[3:3] = ['1 2 3', '7 1', '1 1']
+
+    report_1 = ScriptedController(moves, seed=1).run()
+    report_2 = ScriptedController(moves, seed=1).run()
+
+    assert report_1['turns'] == report_2['turns']
+    assert report_1['turns'] > 0
+    assert report_1['exhausted'] is False
+    assert report_1['outcome'] in ('win', 'loss', 'draw')
+    assert report_1['latency_p50'] <= report_1['latency_p95'] <= report_1['latency_max']
+    assert report_1['ai_moves']['AIPlayer']['moves'] > 0
+
+    report = ScriptedController(moves, seed=1, move_deadline=0.5).run()
+
+    assert report['ai_moves']['AIPlayer']['deadline_misses'] == 0
+
+    # сценарий заканчивается раньше игры
+    report = ScriptedController([(1, 1)], seed=1).run()
+
+    assert report['exhausted'] is True
+    assert report['outcome'] == 'aborted'
+
+    # ошибочная строка сценария прерывает игру, и отчет это показывает
+    report = ScriptedController(['1 1', 'a b', '2 2', '3 3'], seed=3).run()
+
+    assert report['exhausted'] is False
+    assert report['outcome'] == 'aborted'
+
+    # зрители получают каждый выстрел игры
+    hub = SpectatorHub(window=1000)
+    spectator = hub.subscribe()
+
+    assert spectator.poll() == [('snapshot', 0, {})]
+
+    report = ScriptedController(moves, seed=1, spectators=hub).run()
+    messages = spectator.poll()
+
+    assert all(message[0] == 'delta' for message in messages)
+    assert len(messages) == len(hub.snapshot()[2])
+
+    # модель соперника пополняется после каждой завершенной игры
+    model = PlacementModel()
+    ScriptedController(moves, seed=1, opponent_model=model).run()
+    ScriptedController(moves, seed=2, opponent_model=model).run()
+    ScriptedController([(1, 1)], seed=3, opponent_model=model).run()
+
+    assert model.games == 2
+
+    print(report_1)
@@ -0,0 +1,182 @@
+from copy import copy
+from .errors import ChangeForbiddenError
+
+
+class Ship:
+    '''Класс описывающий корабль на доске.
+
+    Аргументы:
+    bow - словарь вида {'x': 0, 'y': 0}, где x и y координаты носа корабля на доске.
+    length - длина корабля.
+    horizontal - расположение корабля.
+
+    Атрибуты экземпляра:
+    bow - словарь вида {'x': 0, 'y': 0}, где x и y координаты носа корабля на доске.
+    length - длина корабля.
+    horizontal - расположение корабля.
+    cells - список ячеек, которые занимает корабль.
+    boundary_cells - список ячеек, которые примыкают к кораблю.
+    sunken - индикатор потопления корабля.
+    hit_mask - битовая маска поврежденных частей, бит i соответствует i-й части от носа.
+    hit_count - количество поврежденных частей.
+    remaining_mask - битовая маска неповрежденных частей.
+    remaining_segments - номера неповрежденных частей.
+    known_orientation - расположение корабля, если его можно определить по попаданиям.
+
+    Методы экземпляра:
+    damage(segment: int) - повреждает часть корабля.
+    repair(segment: int) - восстанавливает часть корабля.
+    is_hit(segment: int) - проверяет, повреждена ли часть корабля.
+    segment_of(x: int, y: int) - возвращает номер части корабля в ячейке.
+    copy - возвращает копию корабля с собственной маской повреждений.
+    '''
+    def __init__(self, bow: dict, length: int, horizontal: bool = True) -> None:
+        self.bow = bow
+        self.length = length
+        self.horizontal = horizontal
+        self.cells = []
+        self.boundary_cells = []
+        # бит i установлен, если повреждена i-я часть корабля от носа
+        self._hits = 0
+        self._full = (1 << length) - 1
+
+    def damage(self, segment: int) -> None:
+        '''Повреждает часть корабля.
+
+        Аргументы:
+        segment - номер части корабля от носа, начиная с 0.
+        '''
+        self._hits |= 1 << segment
+
+    def repair(self, segment: int) -> None:
+        '''Восстанавливает часть корабля.
+
+        Аргументы:
+        segment - номер части корабля от носа, начиная с 0.
+        '''
+        self._hits &= ~(1 << segment)
+
+    def is_hit(self, segment: int) -> bool:
+        '''Проверяет, повреждена ли часть корабля.
+
+        Аргументы:
+        segment - номер части корабля от носа, начиная с 0.
+        '''
+        return bool(self._hits >> segment & 1)
+
+    def segment_of(self, x: int, y: int) -> int:
+        '''Возвращает номер части корабля, которая находится в ячейке.
+
+        Аргументы:
+        x - индекс строки ячейки, как в bow.
+        y - индекс столбца ячейки, как в bow.
+        '''
+        return y - self.bow['y'] if self.horizontal else x - self.bow['x']
+
+    def copy(self) -> 'Ship':
+        '''Возвращает копию корабля с собственной маской повреждений.
+        Списки ячеек разделяются с исходным кораблем и описывают только его положение.'''
+        return copy(self)
+
+    @property
+    def sunken(self) -> bool:
+        '''Проверяет потоплен ли текущий корабль.'''
+        return self._hits == self._full
+
+    @sunken.setter
+    def sunken(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def hit_mask(self) -> int:
+        '''Битовая маска поврежденных частей, бит i соответствует i-й части от носа.'''
+        return self._hits
+
+    @hit_mask.setter
+    def hit_mask(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def hit_count(self) -> int:
+        '''Количество поврежденных частей.'''
+        return bin(self._hits).count('1')
+
+    @hit_count.setter
+    def hit_count(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def remaining_mask(self) -> int:
+        '''Битовая маска неповрежденных частей, бит i соответствует i-й части от носа.'''
+        return self._full & ~self._hits
+
+    @remaining_mask.setter
+    def remaining_mask(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def remaining_segments(self) -> list[int]:
+        '''Номера неповрежденных частей корабля от носа, построенные по remaining_mask.'''
+        mask = self.remaining_mask
+        return [i for i in range(self.length) if mask >> i & 1]
+
+    @remaining_segments.setter
+    def remaining_segments(self, value) -> None:
+        raise ChangeForbiddenError
+
+    @property
+    def known_orientation(self) -> 'bool | None':
+        '''Расположение корабля, которое можно определить по попаданиям:
+        True - горизонтальное, False - вертикальное, None - попаданий меньше двух.'''
+        if self._hits & (self._hits - 1):
+            return self.horizontal
+        return None
+
+    @known_orientation.setter
+    def known_orientation(self, value) -> None:
+        raise ChangeForbiddenError
+
+
+if __name__ == '__main__':
+    bow = {'x': 1, 'y': 2}
+    length = 2
+    ship = Ship(bow, length)
+
+    assert ship.sunken is False
+
+    try:
+        ship.sunken = True
+    except Exception:
+        pass
+
+    assert ship.sunken is False
+
+    ship.damage(1)
+    ship_copy = ship.copy()
+
+    assert ship.is_hit(1) and not ship.is_hit(0)
+    assert ship.known_orientation is None
+
+    ship.damage(0)
+
+    assert ship.sunken is True
+    assert ship_copy.sunken is False
+    assert ship.hit_mask == 0b11 and ship_copy.hit_mask == 0b10
+    assert ship.known_orientation is True
+
+    ship.repair(0)
+
+    assert ship.sunken is False
+    assert ship.hit_count == 1
+    assert ship.remaining_mask == 0b01
+    assert ship.remaining_segments == [0]
+
+    ship = Ship({'x': 1, 'y': 2}, 3, horizontal=False)
+
+    assert [ship.segment_of(x, 2) for x in range(1, 4)] == [0, 1, 2]
+
+    ship.damage(ship.segment_of(3, 2))
+    ship.damage(ship.segment_of(1, 2))
+
+    assert ship.known_orientation is False
+    assert ship.remaining_segments == [1]
@@ -0,0 +1,26 @@
+class Spectator:
+    '''Класс описывающий зрителя игры.
+
+    Зритель хранит только номер последнего полученного изменения, поэтому
+    его очередь ограничена окном журнала концентратора. Если зритель отстал
+    больше чем на окно, накопленные изменения сворачиваются в один снимок.
+
+    Аргументы:
+    hub - концентратор рассылки, на который подписан зритель.
+
+    Методы экземпляра:
+    poll - получить изменения, накопленные с прошлого вызова.
+    '''
+    def __init__(self, hub) -> None:
+        self._hub = hub
+        # номер последнего полученного изменения, -1 - зрителю нужен снимок
+        self._cursor = -1
+
+    def poll(self) -> list[tuple]:
+        '''Получить изменения, накопленные с прошлого вызова.
+        Первым сообщением новому или отставшему зрителю приходит снимок
+        вида ('snapshot', seq, state), далее изменения вида
+        ('delta', seq, board, x, y, outcome, sunk).
+        '''
+        messages, self._cursor = self._hub.read(self._cursor)
+        return messages
@@ -0,0 +1,128 @@
+from functools import partial
+from .board import Board
+from .spectator import Spectator
+
+
+class SpectatorHub:
+    '''Класс описывающий рассылку изменений игры зрителям.
+
+    Каждое изменение доски записывается один раз в кольцевой журнал
+    фиксированного размера, а зрители читают его со своей позиции,
+    поэтому стоимость публикации не зависит от количества зрителей.
+    Текущее состояние досок поддерживается по мере поступления изменений
+    и отдается снимком новым и отставшим зрителям.
+
+    Аргументы:
+    window - количество последних изменений, которые хранятся в журнале.
+
+    Методы экземпляра:
+    attach(name: str, board: Board) - начать рассылку изменений доски.
+    subscribe - подписать нового зрителя.
+    snapshot - вернуть снимок текущего состояния досок.
+    read(cursor: int) - вернуть изменения после указанного номера.
+    '''
+    def __init__(self, window: int = 256) -> None:
+        self._window = window
+        # изменение с номером seq хранится в ячейке seq % window
+        self._ring = [None] * window
+        self._seq = 0
+        # (доска, x, y) -> (результат выстрела, ячейки потопленного корабля)
+        self._state = {}
+        # снимок переиспользуется всеми зрителями, пока состояние не изменилось
+        self._snapshot = None
+
+    def attach(self, name: str, board: Board) -> None:
+        '''Начать рассылку изменений доски.
+
+        Аргументы:
+        name - имя доски в сообщениях зрителям.
+        board - экземпляр класса доски.
+        '''
+        board.add_observer(partial(self._publish, name))
+
+    def subscribe(self) -> Spectator:
+        '''Подписать нового зрителя. Первым сообщением он получит снимок.'''
+        return Spectator(self)
+
+    def snapshot(self) -> tuple:
+        '''Вернуть снимок текущего состояния досок вида ('snapshot', seq, state).
+        Снимок разделяется между зрителями и не должен изменяться.'''
+        if self._snapshot is None or self._snapshot[1] != self._seq:
+            self._snapshot = ('snapshot', self._seq, dict(self._state))
+        return self._snapshot
+
+    def read(self, cursor: int) -> tuple[list[tuple], int]:
+        '''Вернуть изменения после указанного номера и номер последнего из них.
+        Если нужные изменения уже вытеснены из журнала, вместо них возвращается снимок.
+
+        Аргументы:
+        cursor - номер последнего полученного изменения, -1 - нужен снимок.
+        '''
+        messages = []
+
+        if cursor < 0 or cursor < self._seq - self._window:
+            messages.append(self.snapshot())
+            return messages, self._seq
+
+        for seq in range(cursor + 1, self._seq + 1):
+            messages.append(self._ring[seq % self._window])
+        return messages, self._seq
+
+    def _publish(self, name: str, x: int, y: int, outcome: str, sunk: tuple) -> None:
+        '''Записать изменение доски в журнал.
+
+        Аргументы:
+        name - имя доски.
+        x - координата ячейки по оси X.
+        y - координата ячейки по оси Y.
+        outcome - результат выстрела или None при отмене выстрела.
+        sunk - координаты ячеек потопленного корабля.
+        '''
+        self._seq += 1
+        self._ring[self._seq % self._window] = ('delta', self._seq, name, x, y, outcome, sunk)
+
+        if outcome is None:
+            self._state.pop((name, x, y), None)
+        else:
+            self._state[(name, x, y)] = (outcome, sunk)
+
+
+if __name__ == '__main__':
+    from .ship import Ship
+
+    hub = SpectatorHub(window=4)
+    board = Board(verbose=False)
+    board.add_ship(Ship({'x': 0, 'y': 0}, 2))
+    hub.attach('ai', board)
+
+    early = hub.subscribe()
+
+    assert early.poll() == [('snapshot', 0, {})]
+
+    board.process_shot(1, 1)
+    board.process_shot(1, 2)
+
+    assert early.poll() == [('delta', 1, 'ai', 1, 1, 'hit', None),
+                            ('delta', 2, 'ai', 1, 2, 'sunk', ((1, 1), (1, 2)))]
+    assert early.poll() == []
+
+    late = hub.subscribe()
+    snapshot = late.poll()
+
+    assert snapshot[0][:2] == ('snapshot', 2)
+    assert snapshot[0][2][('ai', 1, 2)] == ('sunk', ((1, 1), (1, 2)))
+
+    # отставший зритель получает снимок вместо вытесненных изменений
+    for y in range(1, 7):
+        board.process_shot(3, y)
+    board.undo_shot()
+
+    messages = early.poll()
+
+    assert len(messages) == 1 and messages[0][:2] == ('snapshot', 9)
+    assert ('ai', 3, 6) not in messages[0][2]
+
+    board.process_shot(4, 4)
+
+    assert early.poll() == [('delta', 10, 'ai', 4, 4, 'miss', None)]
+    assert late.poll()[0][0] == 'snapshot'
@@ -0,0 +1,117 @@
+from .random_source import RandomSource
+
+
+class TurnScheduler:
+    '''Класс описывающий очередность ходов игроков в игре на несколько досок.
+
+    Игроки на плаву связаны в кольцо для передачи хода и хранятся в массиве
+    для выбора случайного соперника. Передача хода, выбывание игрока
+    и выбор соперника выполняются за постоянное время независимо
+    от количества игроков.
+
+    Аргументы:
+    players - количество игроков.
+    rng - генератор случайных чисел для выбора соперника.
+
+    Атрибуты экземпляра:
+    current - номер игрока, который сейчас ходит.
+    alive - количество игроков на плаву.
+
+    Методы экземпляра:
+    advance - передать ход следующему игроку на плаву.
+    eliminate(player: int) - исключить игрока из игры.
+    is_alive(player: int) - проверить, что игрок на плаву.
+    random_opponent(player: int) - выбрать случайного соперника на плаву.
+    '''
+    def __init__(self, players: int, rng: RandomSource = None) -> None:
+        self._rng = rng if rng is not None else RandomSource()
+        # соседи игрока в кольце очередности ходов
+        self._next = [(i + 1) % players for i in range(players)]
+        self._prev = [(i - 1) % players for i in range(players)]
+        # игроки на плаву и позиция каждого игрока в этом массиве, -1 - игрок выбыл
+        self._alive = list(range(players))
+        self._position = list(range(players))
+        self._current = 0
+
+    @property
+    def current(self) -> int:
+        '''Номер игрока, который сейчас ходит.'''
+        return self._current
+
+    @property
+    def alive(self) -> int:
+        '''Количество игроков на плаву.'''
+        return len(self._alive)
+
+    def advance(self) -> int:
+        '''Передать ход следующему игроку на плаву и вернуть его номер.'''
+        self._current = self._next[self._current]
+        return self._current
+
+    def is_alive(self, player: int) -> bool:
+        '''Проверить, что игрок на плаву.
+
+        Аргументы:
+        player - номер игрока.
+        '''
+        return self._position[player] >= 0
+
+    def eliminate(self, player: int) -> None:
+        '''Исключить игрока из игры.
+
+        Аргументы:
+        player - номер игрока.
+        '''
+        position = self._position[player]
+
+        if position < 0:
+            return
+
+        prev_player, next_player = self._prev[player], self._next[player]
+        self._next[prev_player] = next_player
+        self._prev[next_player] = prev_player
+
+        # если выбывает ходящий игрок, ход переходит к следующему при вызове advance
+        if player == self._current:
+            self._current = prev_player
+
+        last = self._alive.pop()
+        if last != player:
+            self._alive[position] = last
+            self._position[last] = position
+        self._position[player] = -1
+
+    def random_opponent(self, player: int) -> int:
+        '''Выбрать случайного соперника на плаву.
+
+        Аргументы:
+        player - номер игрока, для которого выбирается соперник.
+        '''
+        i = self._rng.randrange(len(self._alive) - 1)
+
+        if i >= self._position[player]:
+            i += 1
+        return self._alive[i]
+
+
+if __name__ == '__main__':
+    scheduler = TurnScheduler(5, RandomSource(1))
+
+    assert scheduler.alive == 5
+    assert scheduler.advance() == 1
+
+    scheduler.eliminate(2)
+
+    assert scheduler.advance() == 3
+    assert not scheduler.is_alive(2)
+
+    scheduler.eliminate(3)
+
+    assert scheduler.current == 1
+    assert scheduler.advance() == 4
+    assert scheduler.advance() == 0
+    assert scheduler.alive == 3
+
+    for i in range(100):
+        opponent = scheduler.random_opponent(0)
+        assert opponent in (1, 4)